@@ -71,6 +71,7 @@ from .training import (
 # Visualization
 from .visualization import (
     VisualizationConfig,
+    HodgeSpectrumView,
     SpectralCathedralStatic,
     SpectralCathedralInteractive,
     export_visualization_suite,
@@ -103,6 +104,7 @@ __all__ = [
     
     # Visualization
     "VisualizationConfig",
+    "HodgeSpectrumView",
     "SpectralCathedralStatic",
     "SpectralCathedralInteractive",
     "export_visualization_suite",
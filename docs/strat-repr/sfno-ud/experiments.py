@@ -210,7 +210,7 @@ class Trainer:
         # Project intermediate representations onto eigenbasis
         if 'layer_0' in intermediate:
             H = intermediate['layer_0'][0]  # [batch, n_0, d]
-            H_spectral = torch.einsum('nm,bnd->bmd', U_0.T, H)
+            H_spectral = torch.einsum('nm,bnd->bmd', U_0.T.to(H.dtype), H)
             
             # Separate harmonic (λ ≈ 0) and non-harmonic components
             harmonic_mask = Lambda_0 < 1e-6
@@ -360,7 +360,7 @@ class SpectralBiasExperiment:
         
         # Compute error in spectral domain
         error = outputs[0] - targets[0]  # [batch, n_0, d]
-        error_spectral = torch.einsum('nm,bnd->bmd', U_0.T, error)
+        error_spectral = torch.einsum('nm,bnd->bmd', U_0.T.to(error.dtype), error)
         
         # Harmonic error (λ ≈ 0)
         harmonic_mask = Lambda_0 < 1e-6
@@ -27,17 +27,188 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 from torch import Tensor
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Union
 import numpy as np
 from scipy import sparse
-from scipy.sparse.linalg import eigsh
+from scipy.sparse.linalg import LinearOperator, lobpcg, splu
+import hashlib
+import os
+import pickle
 import warnings
+import weakref
+from collections import OrderedDict
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import opt_einsum
+    HAS_OPT_EINSUM = True
+except ImportError:
+    HAS_OPT_EINSUM = False
 
 
 # =============================================================================
 # PART I: Simplicial Complex Data Structures
 # =============================================================================
 
+# In-process eigendecomposition cache: content key -> [(Lambda_k, U_k)] as NumPy,
+# least recently used first; bounded so long sweeps over many complexes do
+# not grow without limit (cache_dir is the unbounded, persistent layer)
+_EIGEN_CACHE: 'OrderedDict[str, List[Tuple[np.ndarray, np.ndarray]]]' = OrderedDict()
+_EIGEN_CACHE_MAX_ENTRIES = 8
+
+
+def _eigen_cache_put(key: str, arrays: List[Tuple[np.ndarray, np.ndarray]]) -> None:
+    """Insert or refresh key in _EIGEN_CACHE, evicting the least recently used."""
+    _EIGEN_CACHE[key] = arrays
+    _EIGEN_CACHE.move_to_end(key)
+    while len(_EIGEN_CACHE) > _EIGEN_CACHE_MAX_ENTRIES:
+        _EIGEN_CACHE.popitem(last=False)
+
+# Shift for the shift-invert preconditioner: just below the PSD spectrum's zero modes
+_EIGSH_SHIFT = -1e-3
+
+# Largest ||L_k v - λ v|| (relative to max(1, |λ|)) accepted from LOBPCG
+# before falling back to dense eigh; lobpcg only warns when it stops early
+_LOBPCG_RESIDUAL_TOL = 1e-4
+
+# Largest n_k decomposed densely with torch.linalg.eigh on CUDA devices
+_GPU_EIGH_MAX_N = 4096
+
+# Side CUDA streams for the adelic branches: model -> device -> one stream per
+# prime. Kept off the module because torch.Stream cannot be pickled, so models
+# stay deep-copyable and torch.save-able after a CUDA forward
+_ADELIC_STREAMS: 'weakref.WeakKeyDictionary[nn.Module, Dict[torch.device, List]]' = \
+    weakref.WeakKeyDictionary()
+
+
+def _incidence_gram(keys: np.ndarray, others: np.ndarray, signs: np.ndarray,
+                    n_keys: int, n: int) -> sparse.csr_matrix:
+    """
+    Assemble G[a, b] = Σ_key s(key, a) s(key, b) from signed incidences.
+    
+    Every pair of incidences sharing a key contributes one entry, so the work
+    is O(nnz(G)) with no matrix product. Keys are faces for B_k^T B_k and
+    cofaces for B_{k+1} B_{k+1}^T.
+    """
+    order = np.argsort(keys, kind='stable')
+    keys, others, signs = keys[order], others[order], signs[order]
+    counts = np.bincount(keys, minlength=n_keys)
+    starts = np.cumsum(counts) - counts
+    
+    # Pair each incidence with every incidence of its key (including itself)
+    per_entry = counts[keys]
+    left = np.repeat(np.arange(len(keys)), per_entry)
+    offsets = np.arange(per_entry.sum()) - np.repeat(np.cumsum(per_entry) - per_entry, per_entry)
+    right = starts[keys[left]] + offsets
+    
+    return sparse.coo_matrix(
+        (signs[left] * signs[right], (others[left], others[right])), shape=(n, n)
+    ).tocsr()
+
+def _bitset_triangles(edges: List[Tuple[int, int]], num_nodes: int,
+                      chunk_bytes: int = 1 << 25) -> List[Tuple[int, int, int]]:
+    """
+    Triangles (u, v, w), u < v < w, of an undirected graph via packed bitsets.
+    
+    Row u of a (num_nodes, ceil(num_nodes/64)) uint64 table holds the
+    neighbours w > u, so for each edge (u, v) the third vertices are the set
+    bits of up[u] & up[v]: 64 intersections per word AND. Edges are processed
+    in chunks of about chunk_bytes of unpacked bits.
+    """
+    if not edges:
+        return []
+    e = np.asarray(edges, dtype=np.int64)
+    u, v = e.min(axis=1), e.max(axis=1)
+    
+    n_words = (num_nodes + 63) // 64
+    up = np.zeros((num_nodes, n_words), dtype=np.uint64)
+    np.bitwise_or.at(up, (u, v >> 6), np.left_shift(np.uint64(1), (v & 63).astype(np.uint64)))
+    
+    triangles = []
+    step = max(1, chunk_bytes // (n_words * 64))
+    for start in range(0, len(u), step):
+        cu, cv = u[start:start + step], v[start:start + step]
+        common = (up[cu] & up[cv]).astype('<u8', copy=False)
+        bits = np.unpackbits(common.view(np.uint8), axis=1, bitorder='little')
+        edge_idx, w = np.nonzero(bits)
+        triangles.append(np.stack([cu[edge_idx], cv[edge_idx], w], axis=1))
+    
+    tri = np.concatenate(triangles)
+    tri = tri[np.lexsort(tri.T[::-1])]
+    return [tuple(t) for t in tri.tolist()]
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _triangles_numba(u, v, indptr, indices):
+        # Merge the sorted upper-neighbour lists of u and v for every edge;
+        # count first so the output is one preallocated int64 buffer
+        n_edges = u.shape[0]
+        counts = np.zeros(n_edges, dtype=np.int64)
+        for e in range(n_edges):
+            a, a_end = indptr[u[e]], indptr[u[e] + 1]
+            b, b_end = indptr[v[e]], indptr[v[e] + 1]
+            while a < a_end and b < b_end:
+                if indices[a] < indices[b]:
+                    a += 1
+                elif indices[a] > indices[b]:
+                    b += 1
+                else:
+                    counts[e] += 1
+                    a += 1
+                    b += 1
+        out = np.empty((counts.sum(), 3), dtype=np.int64)
+        t = 0
+        for e in range(n_edges):
+            if counts[e] == 0:
+                continue
+            a, a_end = indptr[u[e]], indptr[u[e] + 1]
+            b, b_end = indptr[v[e]], indptr[v[e] + 1]
+            while a < a_end and b < b_end:
+                if indices[a] < indices[b]:
+                    a += 1
+                elif indices[a] > indices[b]:
+                    b += 1
+                else:
+                    out[t, 0] = u[e]
+                    out[t, 1] = v[e]
+                    out[t, 2] = indices[a]
+                    t += 1
+                    a += 1
+                    b += 1
+        return out
+
+
+def _graph_triangles(edges: List[Tuple[int, int]], num_nodes: int) -> List[Tuple[int, int, int]]:
+    """
+    Triangles (u, v, w), u < v < w, in lexicographic order.
+    
+    Uses a compiled sorted-list merge over the CSR upper adjacency when numba
+    is installed, otherwise the packed-bitset NumPy path.
+    """
+    if not HAS_NUMBA or not edges:
+        return _bitset_triangles(edges, num_nodes)
+    
+    e = np.asarray(edges, dtype=np.int64)
+    u, v = e.min(axis=1), e.max(axis=1)
+    order = np.lexsort((v, u))
+    u, v = u[order], v[order]
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(u, minlength=num_nodes))])
+    
+    tri = _triangles_numba(u, v, indptr, v)
+    tri = tri[np.lexsort(tri.T[::-1])]
+    return [tuple(t) for t in tri.tolist()]
+
+
+# Per-level operands of an SFNOLayer: (Lambda_k, U_k, B_k, B_{k+1}, B_k^T)
+_LevelContext = Tuple[Tensor, Tensor, Optional[Tensor], Optional[Tensor], Optional[Tensor]]
+
+
 class SimplicialComplex:
     """
     Represents an abstract simplicial complex with precomputed Hodge Laplacians.
@@ -47,8 +218,11 @@ class SimplicialComplex:
     
     Attributes:
         simplices: List of lists, where simplices[k] contains all k-simplices
-        boundary_matrices: List of boundary operator matrices B_k
-        hodge_laplacians: List of Hodge Laplacian matrices L_k
+        sparse_boundaries: List of sparse CSR boundary operators B_k
+        boundary_matrices: Torch sparse CSR copies of the boundary operators
+        coboundary_matrices: Torch sparse CSR transposes B_k^T
+        sparse_laplacians: List of sparse CSR Hodge Laplacians L_k
+        hodge_laplacians: Dense torch Hodge Laplacians (built on first access)
         eigendecompositions: List of (eigenvalues, eigenvectors) tuples
     """
     
@@ -56,7 +230,9 @@ class SimplicialComplex:
         self,
         simplices: List[List[Tuple[int, ...]]],
         max_spectral_modes: int = 64,
-        device: str = 'cpu'
+        device: str = 'cpu',
+        cache_dir: Optional[str] = None,
+        eigenvector_dtype: torch.dtype = torch.float32
     ):
         """
         Initialize simplicial complex with precomputed spectral data.
@@ -65,6 +241,12 @@ class SimplicialComplex:
             simplices: List where simplices[k] is list of k-simplices (as tuples)
             max_spectral_modes: Maximum number of eigenmodes to compute
             device: PyTorch device
+            cache_dir: Optional directory (e.g. ~/.cache/sfno) for persisting
+                eigendecompositions across runs; they are always reused
+                within the process for identical (simplices, modes)
+            eigenvector_dtype: Storage dtype of the eigenvectors U_k, e.g.
+                torch.bfloat16 to halve the traffic of the spectral
+                convolution matmuls; eigenvalues stay float32
         """
         self.simplices = simplices
         self.max_k = len(simplices) - 1
@@ -73,22 +255,51 @@ class SimplicialComplex:
         
         # Number of simplices at each level
         self.n_simplices = [len(s) for s in simplices]
+        self._sorted_simplices = None
         
-        # Compute boundary matrices (Definition 1.9 from Day 1)
-        self.boundary_matrices = self._compute_boundary_matrices()
+        # Compute boundary matrices (Definition 1.9 from Day 1); sparse CSR,
+        # with torch CSR copies (and their transposes) for the model
+        self.sparse_boundaries = self._compute_boundary_matrices()
+        self.boundary_matrices = [self._to_sparse_tensor(B) for B in self.sparse_boundaries]
+        self.coboundary_matrices = [
+            None if B is None else self._to_sparse_tensor(B.T)
+            for B in self.sparse_boundaries
+        ]
         
-        # Compute Hodge Laplacians (Definition 2.2 from Day 2)
-        self.hodge_laplacians = self._compute_hodge_laplacians()
+        # Compute Hodge Laplacians (Definition 2.2 from Day 2); densified lazily
+        self.sparse_laplacians = self._compute_hodge_laplacians()
+        self._hodge_laplacians = None
         
         # Compute truncated eigendecompositions (Section V, Day 2)
-        self.eigendecompositions = self._compute_eigendecompositions()
+        self.eigendecompositions = [
+            (Lambda_k, U_k.to(eigenvector_dtype))
+            for Lambda_k, U_k in self._cached_eigendecompositions(cache_dir)
+        ]
+        self._truncated_spectra: Dict[tuple, Tuple[Tensor, Tensor]] = {}
+        self._boundary_consistency: Dict[int, float] = {}
+        self._level_contexts: Dict[tuple, List[_LevelContext]] = {}
         
         # Compute Betti numbers (Theorem 2.2: dim ker(L_k) = β_k)
         self.betti_numbers = self._compute_betti_numbers()
     
-    def _compute_boundary_matrices(self) -> List[Tensor]:
+    @property
+    def sorted_simplices(self) -> List[np.ndarray]:
         """
-        Compute boundary operator matrices B_k: C_k → C_{k-1}.
+        Simplices of each level as [n_k, k+1] int64 arrays with sorted vertices.
+        
+        Built on first access and cached, so consumers index rows directly
+        instead of calling tuple(sorted(simplex)) per simplex.
+        """
+        if self._sorted_simplices is None:
+            self._sorted_simplices = [
+                np.sort(np.asarray(s, dtype=np.int64).reshape(len(s), k + 1), axis=1)
+                for k, s in enumerate(self.simplices)
+            ]
+        return self._sorted_simplices
+    
+    def _compute_boundary_matrices(self) -> List[Optional[sparse.csr_matrix]]:
+        """
+        Compute boundary operator matrices B_k: C_k → C_{k-1} as sparse CSR.
         
         The boundary of a k-simplex [v_0, ..., v_k] is:
         ∂_k([v_0, ..., v_k]) = Σ_i (-1)^i [v_0, ..., v̂_i, ..., v_k]
@@ -96,84 +307,199 @@ class SimplicialComplex:
         boundaries = [None]  # B_0 doesn't exist (no -1 simplices)
         
         for k in range(1, self.max_k + 1):
-            if self.n_simplices[k] == 0 or self.n_simplices[k-1] == 0:
-                boundaries.append(torch.zeros(
-                    self.n_simplices[k-1], self.n_simplices[k],
-                    device=self.device
-                ))
-                continue
+            shape = (self.n_simplices[k-1], self.n_simplices[k])
             
             # Build sparse boundary matrix
-            rows, cols, vals = [], [], []
-            
-            # Create index maps for (k-1)-simplices
-            simplex_to_idx = {tuple(sorted(s)): i 
-                            for i, s in enumerate(self.simplices[k-1])}
+            rows, cols, vals = self._face_incidences(k)
             
-            for j, sigma in enumerate(self.simplices[k]):
-                sigma = tuple(sorted(sigma))
-                for i, v in enumerate(sigma):
-                    # Face obtained by removing vertex v
-                    face = tuple(x for x in sigma if x != v)
-                    if face in simplex_to_idx:
-                        rows.append(simplex_to_idx[face])
-                        cols.append(j)
-                        vals.append((-1) ** i)
-            
-            if rows:
-                B_k = torch.sparse_coo_tensor(
-                    torch.tensor([rows, cols], device=self.device),
-                    torch.tensor(vals, dtype=torch.float32, device=self.device),
-                    (self.n_simplices[k-1], self.n_simplices[k])
-                ).to_dense()
-            else:
-                B_k = torch.zeros(
-                    self.n_simplices[k-1], self.n_simplices[k],
-                    device=self.device
-                )
-            
-            boundaries.append(B_k)
+            boundaries.append(sparse.coo_matrix(
+                (vals, (rows, cols)), shape=shape
+            ).tocsr())
         
         # Add B_{d+1} as zero matrix for consistency
-        boundaries.append(torch.zeros(
-            self.n_simplices[self.max_k], 0,
-            device=self.device
-        ))
+        boundaries.append(sparse.csr_matrix((self.n_simplices[self.max_k], 0)))
         
         return boundaries
     
-    def _compute_hodge_laplacians(self) -> List[Tensor]:
+    def _face_incidences(self, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Signed incidences (face index, k-simplex index, (-1)^i) of level k.
+        
+        Each simplex is encoded as one mixed-radix int64 key over its sorted
+        vertices, so all face lookups are a single searchsorted per removed
+        vertex instead of a tuple-keyed dict probe per face.
+        """
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0))
+        if self.n_simplices[k] == 0 or self.n_simplices[k-1] == 0:
+            return empty
+        
+        S, F = self.sorted_simplices[k], self.sorted_simplices[k-1]
+        lo = min(S.min(), F.min())
+        base = int(max(S.max(), F.max()) - lo + 1)
+        if base ** k >= 2 ** 63:
+            return self._face_incidences_dict(k)
+        
+        def keys(M):
+            key = np.zeros(len(M), dtype=np.int64)
+            for col in (M - lo).T:
+                key = key * base + col
+            return key
+        
+        # Stable sort + right-bisect picks the last duplicate, as a dict would
+        face_keys = keys(F)
+        face_order = np.argsort(face_keys, kind='stable')
+        face_keys = face_keys[face_order]
+        
+        rows, cols, vals = [], [], []
+        for i in range(k + 1):
+            # Faces obtained by removing vertex i
+            q = keys(np.delete(S, i, axis=1))
+            pos = np.searchsorted(face_keys, q, side='right') - 1
+            found = (pos >= 0) & (face_keys[np.maximum(pos, 0)] == q)
+            rows.append(face_order[pos[found]])
+            cols.append(np.nonzero(found)[0])
+            vals.append(np.full(int(found.sum()), (-1.0) ** i))
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+    
+    def _face_incidences_dict(self, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tuple-keyed fallback for _face_incidences when keys overflow int64."""
+        rows, cols, vals = [], [], []
+        
+        # Create index maps for (k-1)-simplices
+        simplex_to_idx = {tuple(sorted(s)): i 
+                        for i, s in enumerate(self.simplices[k-1])}
+        
+        for j, sigma in enumerate(self.simplices[k]):
+            sigma = tuple(sorted(sigma))
+            for i, v in enumerate(sigma):
+                # Face obtained by removing vertex v
+                face = tuple(x for x in sigma if x != v)
+                if face in simplex_to_idx:
+                    rows.append(simplex_to_idx[face])
+                    cols.append(j)
+                    vals.append((-1) ** i)
+        return (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64),
+                np.asarray(vals, dtype=np.float64))
+    
+    def _compute_hodge_laplacians(self) -> List[sparse.csr_matrix]:
         """
         Compute Hodge Laplacian L_k = B_k^T B_k + B_{k+1} B_{k+1}^T.
         
-        Following Definition 2.2 from Day 2.
+        Following Definition 2.2 from Day 2. Both terms are assembled
+        directly from the signed face incidences: (B_k^T B_k)[σ, σ'] sums
+        sign products over shared faces, (B_{k+1} B_{k+1}^T)[τ, τ'] over
+        shared cofaces. For k = 0 this is the graph Laplacian D - A.
         """
         laplacians = []
         
         for k in range(self.max_k + 1):
             n_k = self.n_simplices[k]
             
-            if n_k == 0:
-                laplacians.append(torch.zeros(0, 0, device=self.device))
-                continue
-            
             # L_k = B_k^T B_k + B_{k+1} B_{k+1}^T
-            L_k = torch.zeros(n_k, n_k, device=self.device)
+            L_k = sparse.csr_matrix((n_k, n_k))
             
-            # Add B_k^T B_k term (from below)
-            if k > 0 and self.boundary_matrices[k] is not None:
-                B_k = self.boundary_matrices[k]
-                L_k += B_k.T @ B_k
+            # Add B_k^T B_k term (from below): k-simplices meeting in a face
+            if k > 0 and self.sparse_boundaries[k] is not None:
+                B_k = self.sparse_boundaries[k].tocoo()
+                L_k = L_k + _incidence_gram(B_k.row, B_k.col, B_k.data,
+                                            B_k.shape[0], n_k)
             
-            # Add B_{k+1} B_{k+1}^T term (from above)
-            if k < self.max_k and self.boundary_matrices[k+1] is not None:
-                B_kp1 = self.boundary_matrices[k+1]
-                L_k += B_kp1 @ B_kp1.T
+            # Add B_{k+1} B_{k+1}^T term (from above): faces of a common coface
+            if k < self.max_k and self.sparse_boundaries[k+1] is not None:
+                B_kp1 = self.sparse_boundaries[k+1].tocoo()
+                L_k = L_k + _incidence_gram(B_kp1.col, B_kp1.row, B_kp1.data,
+                                            B_kp1.shape[1], n_k)
             
-            laplacians.append(L_k)
+            laplacians.append(sparse.csr_matrix(L_k))
         
         return laplacians
     
+    def _to_dense_tensor(self, M: Optional[sparse.spmatrix]) -> Optional[Tensor]:
+        """
+        Densify a sparse operator at the PyTorch boundary.
+        
+        Scatters the nonzeros straight into a zeroed tensor with index_put_,
+        so no intermediate dense NumPy array or COO tensor is allocated.
+        """
+        if M is None:
+            return None
+        M = M.tocoo()
+        dense = torch.zeros(M.shape, dtype=torch.float32, device=self.device)
+        if M.nnz:
+            index = (torch.as_tensor(M.row, dtype=torch.long, device=self.device),
+                     torch.as_tensor(M.col, dtype=torch.long, device=self.device))
+            dense.index_put_(index, torch.as_tensor(M.data, dtype=torch.float32,
+                                                     device=self.device), accumulate=True)
+        return dense
+    
+    def level_contexts(
+        self,
+        n_modes: Tuple[int, ...],
+        dtypes: Tuple[Optional[torch.dtype], ...]
+    ) -> List[_LevelContext]:
+        """
+        Per-level (Lambda_k, U_k, B_k, B_{k+1}, B_k^T), with spectra truncated
+        to n_modes[k] (U_k cast to dtypes[k] if given). Cached on the complex
+        per (n_modes, dtypes), so layers hold no references to it.
+        """
+        key = (tuple(n_modes), tuple(dtypes))
+        if key not in self._level_contexts:
+            max_k = len(n_modes) - 1
+            contexts = []
+            for k in range(max_k + 1):
+                Lambda_k, U_k = self.get_truncated_spectrum(k, n_modes[k], dtypes[k])
+                B_k = self.boundary_matrices[k] if k > 0 else None
+                B_kp1 = self.boundary_matrices[k+1] if k < max_k else None
+                B_k_T = self.coboundary_matrices[k] if k > 0 else None
+                contexts.append((Lambda_k, U_k, B_k, B_kp1, B_k_T))
+            self._level_contexts[key] = contexts
+        return self._level_contexts[key]
+    
+    def boundary_consistency(self, k: int) -> float:
+        """
+        Mean squared entry of ∂_k ∘ ∂_{k+1}, computed once from the sparse CSR
+        boundaries and cached. It is 0 for any valid complex (∂∘∂ = 0).
+        """
+        if k not in self._boundary_consistency:
+            B_k, B_kp1 = self.sparse_boundaries[k], self.sparse_boundaries[k + 1]
+            if B_k is None or B_kp1 is None or B_k.shape[0] * B_kp1.shape[1] == 0:
+                value = 0.0
+            else:
+                composition = B_k @ B_kp1
+                value = float(composition.multiply(composition).sum()) / (
+                    B_k.shape[0] * B_kp1.shape[1])
+            self._boundary_consistency[k] = value
+        return self._boundary_consistency[k]
+    
+    def _to_sparse_tensor(self, M: Optional[sparse.spmatrix]) -> Optional[Tensor]:
+        """
+        Copy a SciPy sparse operator into a torch sparse CSR tensor.
+        
+        SciPy's canonical CSR already satisfies the layout invariants, so
+        checks are skipped; torch's "CSR support is in beta" notice is
+        silenced here rather than on every complex construction.
+        """
+        if M is None:
+            return None
+        M = sparse.csr_matrix(M)
+        M.sum_duplicates()
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='Sparse CSR tensor support is in beta',
+                                    category=UserWarning)
+            return torch.sparse_csr_tensor(
+                torch.as_tensor(M.indptr, dtype=torch.long),
+                torch.as_tensor(M.indices, dtype=torch.long),
+                torch.as_tensor(M.data, dtype=torch.float32),
+                size=M.shape, device=self.device, check_invariants=False
+            )
+    
+    @property
+    def hodge_laplacians(self) -> List[Tensor]:
+        """Dense torch copies of sparse_laplacians, built on first access."""
+        if self._hodge_laplacians is None:
+            self._hodge_laplacians = [self._to_dense_tensor(L) for L in self.sparse_laplacians]
+        return self._hodge_laplacians
+    
     def _compute_eigendecompositions(self) -> List[Tuple[Tensor, Tensor]]:
         """
         Compute truncated eigendecomposition of each Hodge Laplacian.
@@ -182,7 +508,7 @@ class SimplicialComplex:
         """
         decompositions = []
         
-        for k, L_k in enumerate(self.hodge_laplacians):
+        for k, L_k in enumerate(self.sparse_laplacians):
             n_k = L_k.shape[0]
             
             if n_k == 0:
@@ -195,24 +521,45 @@ class SimplicialComplex:
             # Number of modes to compute
             n_modes = min(self.max_modes, n_k)
             
-            # Use scipy for eigendecomposition (more stable for sparse)
-            L_np = L_k.cpu().numpy()
+            if str(self.device).startswith('cuda') and n_k <= _GPU_EIGH_MAX_N:
+                # Dense cuSOLVER eigh on device, no NumPy round trip; float64
+                # so the near-zero (harmonic) eigenvalues stay below tolerance
+                eigenvalues, eigenvectors = torch.linalg.eigh(
+                    self._to_dense_tensor(L_k).double()
+                )
+                decompositions.append((
+                    eigenvalues[:n_modes].float(),
+                    eigenvectors[:, :n_modes].float().contiguous()
+                ))
+                continue
             
-            if n_modes < n_k - 1:
-                # Truncated eigendecomposition
+            if 5 * n_modes < n_k:
+                # Block LOBPCG preconditioned by a factorization of L_k - σI
+                # (shift-invert). σ sits just below 0 since L_k is PSD and
+                # usually singular; the block resolves degenerate harmonic
+                # modes that single-vector Lanczos tends to miss
                 try:
-                    eigenvalues, eigenvectors = eigsh(
-                        L_np, k=n_modes, which='SM', 
-                        tol=1e-6, maxiter=1000
+                    lu = splu((L_k - _EIGSH_SHIFT * sparse.identity(n_k)).tocsc())
+                    M = LinearOperator((n_k, n_k), matvec=lu.solve, matmat=lu.solve,
+                                       dtype=np.float64)
+                    X0 = np.random.default_rng(k).standard_normal((n_k, n_modes))
+                    eigenvalues, eigenvectors = lobpcg(
+                        L_k, X0, M=M, largest=False, tol=1e-6, maxiter=200
                     )
-                except:
+                    residual = np.linalg.norm(L_k @ eigenvectors - eigenvectors * eigenvalues,
+                                              axis=0)
+                    if np.any(residual > _LOBPCG_RESIDUAL_TOL * np.maximum(1.0, np.abs(eigenvalues))):
+                        raise np.linalg.LinAlgError("LOBPCG did not converge")
+                except Exception:
                     # Fall back to full decomposition
-                    eigenvalues, eigenvectors = np.linalg.eigh(L_np)
+                    eigenvalues, eigenvectors = np.linalg.eigh(L_k.toarray())
                     eigenvalues = eigenvalues[:n_modes]
                     eigenvectors = eigenvectors[:, :n_modes]
             else:
-                # Full decomposition
-                eigenvalues, eigenvectors = np.linalg.eigh(L_np)
+                # Dense decomposition, truncated to the requested modes
+                eigenvalues, eigenvectors = np.linalg.eigh(L_k.toarray())
+                eigenvalues = eigenvalues[:n_modes]
+                eigenvectors = eigenvectors[:, :n_modes]
             
             # Sort by eigenvalue (ascending)
             idx = np.argsort(eigenvalues)
@@ -227,6 +574,65 @@ class SimplicialComplex:
         
         return decompositions
     
+    def _cached_eigendecompositions(
+        self, cache_dir: Optional[str] = None
+    ) -> List[Tuple[Tensor, Tensor]]:
+        """
+        Eigendecompositions keyed by a content hash of (simplices, max_modes).
+        
+        Looks in the in-process LRU cache (_EIGEN_CACHE_MAX_ENTRIES complexes),
+        then in cache_dir/<key>.npz, and only runs the eigensolver on a miss.
+        """
+        key = hashlib.blake2b(
+            pickle.dumps((self.simplices, self.max_modes)), digest_size=16
+        ).hexdigest()
+        path = os.path.join(os.path.expanduser(cache_dir), f"{key}.npz") if cache_dir else None
+        
+        arrays = _EIGEN_CACHE.get(key)
+        if arrays is None and path is not None and os.path.exists(path):
+            with np.load(path) as f:
+                arrays = [(f[f'Lambda_{k}'], f[f'U_{k}']) for k in range(int(f['n_levels']))]
+        
+        if arrays is None:
+            decompositions = self._compute_eigendecompositions()
+            arrays = [(Lam.cpu().numpy().copy(), U.cpu().numpy().copy())
+                      for Lam, U in decompositions]
+            if path is not None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                np.savez(path, n_levels=len(arrays),
+                         **{f'Lambda_{k}': Lam for k, (Lam, _) in enumerate(arrays)},
+                         **{f'U_{k}': U for k, (_, U) in enumerate(arrays)})
+            _eigen_cache_put(key, arrays)
+            return decompositions
+        
+        _eigen_cache_put(key, arrays)
+        # Copies, so one complex cannot mutate another's spectra through the cache
+        return [(torch.tensor(Lam, device=self.device), torch.tensor(U, device=self.device))
+                for Lam, U in arrays]
+    
+    def get_truncated_spectrum(
+        self,
+        k: int,
+        n_modes: int,
+        dtype: Optional[torch.dtype] = None
+    ) -> Tuple[Tensor, Tensor]:
+        """
+        (Lambda_k[:n_modes], U_k[:, :n_modes]) as contiguous tensors.
+        
+        Cached per (k, n_modes, dtype), so layers reuse one copy instead of
+        slicing a strided view of U_k on every forward. dtype optionally
+        casts U_k (e.g. bfloat16); eigenvalues stay float32.
+        """
+        key = (k, n_modes, dtype)
+        if key not in self._truncated_spectra:
+            Lambda_k, U_k = self.eigendecompositions[k]
+            U_k = U_k[:, :n_modes]
+            self._truncated_spectra[key] = (
+                Lambda_k[:n_modes].contiguous(),
+                (U_k if dtype is None else U_k.to(dtype)).contiguous()
+            )
+        return self._truncated_spectra[key]
+    
     def _compute_betti_numbers(self, tol: float = 1e-6) -> List[int]:
         """
         Compute Betti numbers as dimensions of Hodge Laplacian kernels.
@@ -268,20 +674,7 @@ class SimplicialComplex:
         
         # 2-simplices: triangles (if requested)
         if include_triangles:
-            # Build adjacency for triangle detection
-            adj = {i: set() for i in range(num_nodes)}
-            for e in edges:
-                adj[e[0]].add(e[1])
-                adj[e[1]].add(e[0])
-            
-            triangles = set()
-            for u in range(num_nodes):
-                for v in adj[u]:
-                    for w in adj[u] & adj[v]:
-                        if u < v < w:
-                            triangles.add((u, v, w))
-            
-            simplices.append(list(triangles))
+            simplices.append(_graph_triangles(edges, num_nodes))
         
         return cls(simplices, **kwargs)
     
@@ -312,6 +705,21 @@ class SimplicialComplex:
 # PART II: Spectral Convolution Layer
 # =============================================================================
 
+def _chebyshev_filter(Lambda_normalized: Tensor, degrees: Tensor, poly_coeffs: Tensor) -> Tensor:
+    """Σ_p c_p T_p(λ) with T_p(λ) = cos(p·arccos λ): [n_modes, in, out]."""
+    theta = torch.acos(Lambda_normalized.clamp(-1.0, 1.0))
+    T = torch.cos(degrees[:, None] * theta[None, :])  # [poly_order, n_modes]
+    poly_order, d_in, d_out = poly_coeffs.shape
+    return (T.t() @ poly_coeffs.reshape(poly_order, d_in * d_out)).view(-1, d_in, d_out)
+
+
+# Inductor-fused variant (compiled lazily on first call); eager on PyTorch < 2.0
+_chebyshev_filter_compiled = (
+    torch.compile(_chebyshev_filter, dynamic=True, fullgraph=True)
+    if hasattr(torch, 'compile') else _chebyshev_filter
+)
+
+
 class SpectralConvolution(nn.Module):
     """
     Spectral convolution on k-forms using the Hodge eigenbasis.
@@ -326,7 +734,10 @@ class SpectralConvolution(nn.Module):
         in_features: int,
         out_features: int,
         n_modes: int,
-        filter_type: str = 'mlp'
+        filter_type: str = 'mlp',
+        compile_filter: bool = False,
+        autocast_dtype: Optional[torch.dtype] = None,
+        filter_dtype: torch.dtype = torch.float32
     ):
         """
         Args:
@@ -334,8 +745,21 @@ class SpectralConvolution(nn.Module):
             out_features: Output feature dimension
             n_modes: Number of spectral modes
             filter_type: 'mlp' for learned filter, 'polynomial' for Chebyshev
+            compile_filter: Build the Chebyshev filter with torch.compile
+                (one fused kernel; pays a one-off compile on first forward)
+            autocast_dtype: Run the basis/filter contraction under autocast
+                in this dtype (e.g. torch.bfloat16; matmuls accumulate in
+                fp32). The filter itself is built in fp32, and the output
+                is returned in the input dtype
+            filter_dtype: Storage dtype of the learned 'mlp' filter, e.g.
+                torch.bfloat16 to halve its memory and checkpoint size; it
+                is cast to the compute dtype in forward
         """
         super().__init__()
+        self.compile_filter = compile_filter
+        self.autocast_dtype = autocast_dtype
+        # opt_einsum contraction plans, keyed on operand shapes
+        self._cached_expr: Dict[Tuple[torch.Size, ...], 'opt_einsum.contract.ContractExpression'] = {}
         self.in_features = in_features
         self.out_features = out_features
         self.n_modes = n_modes
@@ -345,7 +769,7 @@ class SpectralConvolution(nn.Module):
             # Learnable spectral filter: g_θ(λ) as diagonal matrix
             # Shape: [n_modes, in_features, out_features]
             self.spectral_filter = nn.Parameter(
-                torch.randn(n_modes, in_features, out_features) * 0.02
+                (torch.randn(n_modes, in_features, out_features) * 0.02).to(filter_dtype)
             )
         elif filter_type == 'polynomial':
             # Chebyshev polynomial filter
@@ -353,6 +777,9 @@ class SpectralConvolution(nn.Module):
             self.poly_coeffs = nn.Parameter(
                 torch.randn(self.poly_order, in_features, out_features) * 0.02
             )
+            self.register_buffer('poly_degrees', torch.arange(self.poly_order,
+                                                              dtype=torch.float32),
+                                 persistent=False)
         else:
             raise ValueError(f"Unknown filter type: {filter_type}")
     
@@ -376,46 +803,76 @@ class SpectralConvolution(nn.Module):
         batch_size, n_simplices, _ = X.shape
         n_modes = min(self.n_modes, U.shape[1])
         
-        # Transform to spectral domain: X_spec = U^T X
-        # [batch, n_modes, in_features]
-        U_truncated = U[:, :n_modes]
-        X_spectral = torch.einsum('nm,bni->bmi', U_truncated.T, X)
+        # No-op when U comes from SimplicialComplex.get_truncated_spectrum
+        U_truncated = U if U.shape[1] == n_modes else U[:, :n_modes]
         
         if self.filter_type == 'mlp':
-            # Apply learned spectral filter
-            # g_θ(Λ) is diagonal, applied mode-wise
+            # Learned spectral filter g_θ(Λ), diagonal, applied mode-wise
             filter_truncated = self.spectral_filter[:n_modes]
-            X_filtered = torch.einsum('mio,bmi->bmo', filter_truncated, X_spectral)
         else:
-            # Chebyshev polynomial filter
+            # Chebyshev polynomial filter: all T_p(λ) = cos(p·arccos λ) at once
+            # (λ normalized into [0, 1)), then one contraction with the coefficients
             Lambda_normalized = Lambda[:n_modes] / (Lambda[:n_modes].max() + 1e-6)
-            filter_response = torch.zeros(n_modes, self.in_features, self.out_features,
-                                         device=X.device)
-            T_prev = torch.ones(n_modes, device=X.device)
-            T_curr = Lambda_normalized
-            
-            filter_response += self.poly_coeffs[0].unsqueeze(0) * T_prev.unsqueeze(-1).unsqueeze(-1)
-            if self.poly_order > 1:
-                filter_response += self.poly_coeffs[1].unsqueeze(0) * T_curr.unsqueeze(-1).unsqueeze(-1)
-            
-            for i in range(2, self.poly_order):
-                T_next = 2 * Lambda_normalized * T_curr - T_prev
-                filter_response += self.poly_coeffs[i].unsqueeze(0) * T_next.unsqueeze(-1).unsqueeze(-1)
-                T_prev, T_curr = T_curr, T_next
-            
-            X_filtered = torch.einsum('mio,bmi->bmo', filter_response, X_spectral)
+            chebyshev = _chebyshev_filter_compiled if self.compile_filter else _chebyshev_filter
+            filter_truncated = chebyshev(Lambda_normalized, self.poly_degrees, self.poly_coeffs)
         
-        # Transform back to spatial domain: Y = U X_filtered
-        # [batch, n_simplices, out_features]
-        Y = torch.einsum('nm,bmo->bno', U_truncated, X_filtered)
+        if self.autocast_dtype is None:
+            # [batch, n_simplices, out_features]
+            return self._contract(U_truncated, filter_truncated.to(X.dtype), X)
         
-        return Y
+        with torch.autocast(device_type=X.device.type, dtype=self.autocast_dtype):
+            Y = self._contract(U_truncated.to(self.autocast_dtype), filter_truncated,
+                               X.to(self.autocast_dtype))
+        return Y.to(X.dtype)
+    
+    def _contract(self, U: Tensor, filt: Tensor, X: Tensor) -> Tensor:
+        """
+        Y = U · g_θ(Λ) · U^T · X as a single contraction.
+        
+        With opt_einsum available the bracketing of the four operands is
+        planned once per shape (contract_expression) and reused; otherwise
+        (or for reduced-precision U, which cannot share an einsum with fp32
+        operands) the order is U^T X → filter → U.
+        """
+        if U.dtype == X.dtype and HAS_OPT_EINSUM:
+            key = (U.shape, filt.shape, X.shape)
+            expr = self._cached_expr.get(key)
+            if expr is None:
+                expr = opt_einsum.contract_expression(
+                    'nm,mio,km,bki->bno', U.shape, filt.shape, U.shape, X.shape,
+                    optimize='optimal'
+                )
+                self._cached_expr[key] = expr
+            return expr(U, filt, U, X, backend='torch')
+        
+        # Spectral domain X_spec = U^T X, basis matmuls in U's dtype
+        X_spectral = torch.einsum('km,bki->bmi', U, X.to(U.dtype)).to(X.dtype)
+        # Mode-wise filter as one batched GEMM over modes: [M, B, I] @ [M, I, O]
+        X_filtered = torch.bmm(X_spectral.transpose(0, 1), filt).transpose(0, 1)
+        return torch.einsum('nm,bmo->bno', U, X_filtered.to(U.dtype)).to(X.dtype)
 
 
 # =============================================================================
 # PART III: Boundary Coupling Layer
 # =============================================================================
 
+def _apply_operator(B: Tensor, X: Tensor) -> Tensor:
+    """
+    Apply an [n_out, n_in] operator to batched features X [batch, n_in, d].
+    
+    Dense B broadcasts over the batch as one matmul. Sparse B takes the
+    batch folded into the columns ([n_in, batch * d]), so a single
+    torch.sparse.mm serves the whole batch.
+    """
+    if B.layout == torch.strided:
+        return B @ X
+    if B.layout == torch.sparse_csc:  # e.g. the transpose of a CSR matrix
+        B = B.to_sparse_csr()
+    batch, n_in, d = X.shape
+    Y = torch.sparse.mm(B, X.transpose(0, 1).reshape(n_in, batch * d))
+    return Y.reshape(B.shape[0], batch, d).transpose(0, 1)
+
+
 class BoundaryCoupling(nn.Module):
     """
     Couples information between simplicial levels via boundary operators.
@@ -454,7 +911,8 @@ class BoundaryCoupling(nn.Module):
         X_k_minus_1: Optional[Tensor],
         X_k_plus_1: Optional[Tensor],
         B_k: Optional[Tensor],      # [n_{k-1}, n_k]
-        B_k_plus_1: Optional[Tensor] # [n_k, n_{k+1}]
+        B_k_plus_1: Optional[Tensor], # [n_k, n_{k+1}]
+        B_k_T: Optional[Tensor] = None # [n_k, n_{k-1}], defaults to B_k.t()
     ) -> Tensor:
         """
         Compute boundary coupling.
@@ -465,32 +923,33 @@ class BoundaryCoupling(nn.Module):
             X_k_plus_1: Features at level k+1 [batch, n_{k+1}, dim_{k+1}]
             B_k: Boundary matrix k
             B_k_plus_1: Boundary matrix k+1
+            B_k_T: Precomputed coboundary B_k^T (saves converting the
+                transpose of a sparse CSR B_k on every call)
             
         Returns:
             Coupled features [batch, n_k, dim_k]
         """
-        batch_size = X_k.shape[0]
+        # Each term is accumulated with one fused in-place multiply-add
         output = torch.zeros_like(X_k)
         
         # Information from above: B_{k+1} · W_↓ · X_{k+1}
         if (self.has_above and X_k_plus_1 is not None and 
             B_k_plus_1 is not None and X_k_plus_1.shape[1] > 0):
             # Project features
-            X_down = self.W_down(X_k_plus_1)  # [batch, n_{k+1}, dim_k]
+            X_down = F.linear(X_k_plus_1, self.W_down.weight)  # [batch, n_{k+1}, dim_k]
             # Apply boundary: aggregate from faces
             # B_{k+1}: [n_k, n_{k+1}]
-            coupled_down = torch.einsum('ij,bji->bi', B_k_plus_1, X_down.transpose(1, 2))
-            output += self.beta * coupled_down.unsqueeze(-1).expand(-1, -1, self.dim_k)
+            output.addcmul_(self.beta, _apply_operator(B_k_plus_1, X_down))
         
         # Information from below: B_k^T · W_↑ · X_{k-1}
         if (self.has_below and X_k_minus_1 is not None and 
             B_k is not None and X_k_minus_1.shape[1] > 0):
             # Project features
-            X_up = self.W_up(X_k_minus_1)  # [batch, n_{k-1}, dim_k]
+            X_up = F.linear(X_k_minus_1, self.W_up.weight)  # [batch, n_{k-1}, dim_k]
             # Apply coboundary: aggregate to cofaces
             # B_k^T: [n_k, n_{k-1}]
-            coupled_up = torch.einsum('ij,bji->bi', B_k.T, X_up.transpose(1, 2))
-            output += self.gamma * coupled_up.unsqueeze(-1).expand(-1, -1, self.dim_k)
+            output.addcmul_(self.gamma, _apply_operator(
+                B_k.t() if B_k_T is None else B_k_T, X_up))
         
         return output
 
@@ -499,6 +958,27 @@ class BoundaryCoupling(nn.Module):
 # PART IV: S-FNO Layer
 # =============================================================================
 
+def _postprocess(
+    mixed: Tensor,
+    R: Tensor,
+    norm: nn.LayerNorm,
+    p: float,
+    training: bool,
+    gelu: bool = True
+) -> Tensor:
+    """dropout(σ(LayerNorm(mixed + R))) for one level."""
+    Y = norm(mixed + R)
+    Y = F.gelu(Y) if gelu else F.relu(Y)
+    return F.dropout(Y, p, training)
+
+
+# Inductor-fused variant: reads mixed and R once, writes Y once
+_postprocess_compiled = (
+    torch.compile(_postprocess, dynamic=True)
+    if hasattr(torch, 'compile') else _postprocess
+)
+
+
 class SFNOLayer(nn.Module):
     """
     Single S-FNO layer operating on all simplicial levels.
@@ -513,23 +993,40 @@ class SFNOLayer(nn.Module):
         dims: List[int],           # Feature dimensions at each level [d_0, d_1, ...]
         n_modes: List[int],        # Spectral modes at each level
         dropout: float = 0.1,
-        activation: str = 'gelu'
+        activation: str = 'gelu',
+        fuse_levels: bool = False,
+        spectral_dtype: Optional[torch.dtype] = None,
+        compile_tail: bool = False
     ):
+        """
+        Args:
+            spectral_dtype: Autocast dtype of the spectral convolutions
+                (e.g. torch.bfloat16); U_k is fetched from the complex
+                pre-cast so it is converted once, not every forward.
+            compile_tail: With fuse_levels=False, run each level's residual
+                add + LayerNorm + activation + dropout as one torch.compile'd
+                kernel (pays a one-off compile on first forward)
+            fuse_levels: Run LayerNorm + activation + dropout for all levels
+                on one packed [batch, total_n, max_d] tensor instead of one
+                kernel chain per level. Trades feature padding up to max_d
+                for max_k+1 times fewer launches; only worth it where launch
+                overhead dominates (GPU), on CPU the per-level path is faster.
+        """
         super().__init__()
         self.dims = dims
         self.max_k = len(dims) - 1
+        self.fuse_levels = fuse_levels
+        self.compile_tail = compile_tail
         
         # Spectral convolutions at each level
         self.spectral_convs = nn.ModuleList([
-            SpectralConvolution(dims[k], dims[k], n_modes[k])
+            SpectralConvolution(dims[k], dims[k], n_modes[k],
+                                autocast_dtype=spectral_dtype)
             for k in range(self.max_k + 1)
         ])
         
-        # Mixing coefficients (learnable)
-        self.alpha = nn.ParameterList([
-            nn.Parameter(torch.tensor(1.0))
-            for _ in range(self.max_k + 1)
-        ])
+        # Mixing coefficients (learnable), one entry per level
+        self.alpha = nn.Parameter(torch.ones(self.max_k + 1))
         
         # Boundary coupling at each level
         self.boundary_couplings = nn.ModuleList()
@@ -559,6 +1056,7 @@ class SFNOLayer(nn.Module):
         
         # Activation
         self.activation = F.gelu if activation == 'gelu' else F.relu
+        self._gelu = activation == 'gelu'
     
     def forward(
         self,
@@ -576,46 +1074,126 @@ class SFNOLayer(nn.Module):
         Returns:
             List of output feature tensors
         """
-        outputs = []
+        contexts = self.prepare(complex)
+        mixed = [None] * (self.max_k + 1)
         
         for k in range(self.max_k + 1):
-            X_k = X[k]
-            batch_size, n_k, d_k = X_k.shape
-            
             # Skip if no simplices at this level
-            if n_k == 0:
-                outputs.append(X_k)
+            if X[k].shape[1] == 0:
+                continue
+            mixed[k] = self._mix_level(k, X, contexts[k])
+        
+        if self.fuse_levels:
+            return self._fused_tail(X, mixed)
+        
+        postprocess = _postprocess_compiled if self.compile_tail else _postprocess
+        outputs = []
+        for k in range(self.max_k + 1):
+            if mixed[k] is None:
+                outputs.append(X[k])
                 continue
-            
-            # Get spectral data
-            Lambda_k, U_k = complex.eigendecompositions[k]
-            
-            # 1. Spectral convolution
-            S_k = self.spectral_convs[k](X_k, U_k, Lambda_k)
-            S_k = self.alpha[k] * S_k
-            
-            # 2. Boundary coupling
-            X_below = X[k-1] if k > 0 else None
-            X_above = X[k+1] if k < self.max_k else None
-            B_k = complex.boundary_matrices[k] if k > 0 else None
-            B_kp1 = complex.boundary_matrices[k+1] if k < self.max_k else None
-            
-            B_coupled = self.boundary_couplings[k](
-                X_k, X_below, X_above, B_k, B_kp1
-            )
             
             # 3. Residual
-            R_k = self.residuals[k](X_k)
+            R_k = self.residuals[k](X[k])
             
             # 4. Combine and activate
-            Y_k = S_k + B_coupled + R_k
-            Y_k = self.norms[k](Y_k)
-            Y_k = self.activation(Y_k)
-            Y_k = self.dropout(Y_k)
+            Y_k = postprocess(mixed[k], R_k, self.norms[k], self.dropout.p,
+                              self.training, self._gelu)
             
             outputs.append(Y_k)
         
         return outputs
+    
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        """Accept checkpoints that stored alpha as a ParameterList (alpha.0 ... alpha.k)."""
+        legacy = [f'{prefix}alpha.{k}' for k in range(self.max_k + 1)]
+        if f'{prefix}alpha' not in state_dict and all(key in state_dict for key in legacy):
+            state_dict[f'{prefix}alpha'] = torch.stack(
+                [state_dict.pop(key).reshape(()) for key in legacy])
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+    
+    def prepare(self, complex: SimplicialComplex) -> List[_LevelContext]:
+        """
+        Per-level (Lambda_k, U_k, B_k, B_{k+1}, B_k^T) for complex, with spectra
+        pre-truncated to each level's modes; cached on the complex itself.
+        """
+        return complex.level_contexts(
+            tuple(conv.n_modes for conv in self.spectral_convs),
+            tuple(conv.autocast_dtype for conv in self.spectral_convs)
+        )
+    
+    def _mix_level(
+        self,
+        k: int,
+        X: List[Tensor],
+        context: _LevelContext
+    ) -> Tensor:
+        """α_k · S_k(X_k) + B_k(X) for one level."""
+        X_k = X[k]
+        Lambda_k, U_k, B_k, B_kp1, B_k_T = context
+        
+        # 1. Spectral convolution
+        S_k = self.spectral_convs[k](X_k, U_k, Lambda_k)
+        S_k = self.alpha[k] * S_k
+        
+        # 2. Boundary coupling
+        X_below = X[k-1] if k > 0 else None
+        X_above = X[k+1] if k < self.max_k else None
+        
+        B_coupled = self.boundary_couplings[k](
+            X_k, X_below, X_above, B_k, B_kp1, B_k_T
+        )
+        return S_k + B_coupled
+    
+    def _fused_tail(self, X: List[Tensor], mixed: List[Optional[Tensor]]) -> List[Tensor]:
+        """
+        Residual, LayerNorm, activation and dropout for all levels at once.
+        
+        Levels are packed along the simplex axis into one [batch, total_n,
+        max_d] tensor (features zero-padded to max_d, no row padding) with
+        per-row level offsets. LayerNorm is masked to each row's own d_k
+        features, so results match the per-level path; outputs are views
+        into the packed tensor.
+        """
+        levels = [k for k in range(self.max_k + 1) if mixed[k] is not None]
+        if not levels:
+            return list(X)
+        max_d = max(self.dims[k] for k in levels)
+        
+        # 3. Residual per level (level-specific W_res), packed as it is combined
+        Y = torch.cat([
+            F.pad(mixed[k] + F.linear(X[k], self.residuals[k].weight),
+                  (0, max_d - self.dims[k]))
+            for k in levels
+        ], dim=1)
+        
+        # Per-row level index, then per-row d_k, γ and β
+        counts = [X[k].shape[1] for k in levels]
+        row_level = torch.repeat_interleave(
+            torch.arange(len(levels), device=Y.device),
+            torch.tensor(counts, device=Y.device)
+        )
+        d = torch.tensor([self.dims[k] for k in levels], dtype=Y.dtype,
+                         device=Y.device)[row_level].unsqueeze(-1)  # [total_n, 1]
+        gamma = torch.stack([F.pad(self.norms[k].weight, (0, max_d - self.dims[k])) for k in levels])
+        beta = torch.stack([F.pad(self.norms[k].bias, (0, max_d - self.dims[k])) for k in levels])
+        
+        # 4. LayerNorm over each row's first d_k features
+        mask = (torch.arange(max_d, device=Y.device) < d).to(Y.dtype)
+        mean = (Y * mask).sum(-1, keepdim=True) / d
+        centered = (Y - mean) * mask
+        var = (centered ** 2).sum(-1, keepdim=True) / d
+        eps = self.norms[levels[0]].eps
+        Y = centered * torch.rsqrt(var + eps) * gamma[row_level] + beta[row_level]
+        
+        Y = self.dropout(self.activation(Y))
+        
+        outputs = list(X)
+        offset = 0
+        for k, n_k in zip(levels, counts):
+            outputs[k] = Y[:, offset:offset + n_k, :self.dims[k]]
+            offset += n_k
+        return outputs
 
 
 # =============================================================================
@@ -724,7 +1302,9 @@ class SFNO_UD(nn.Module):
             
         Returns:
             outputs: List of output features
-            intermediate: Dict of intermediate values (if requested)
+            intermediate: Dict of intermediate values (if requested); these
+                share storage with the layer outputs, which are never
+                modified in place
         """
         intermediate = {} if return_intermediate else None
         
@@ -732,23 +1312,33 @@ class SFNO_UD(nn.Module):
         H = [self.input_projs[k](X[k]) for k in range(self.max_k + 1)]
         
         if return_intermediate:
-            intermediate['input'] = [h.clone() for h in H]
+            intermediate['input'] = list(H)
         
         # Main S-FNO layers
         for l, layer in enumerate(self.layers):
             H = layer(H, complex)
             
             if return_intermediate:
-                intermediate[f'layer_{l}'] = [h.clone() for h in H]
+                intermediate[f'layer_{l}'] = list(H)
         
         # Adelic processing (optional)
         if self.use_adelic:
+            # Branches only read H, so on CUDA each prime runs on its own stream
+            streams = self._adelic_streams(H[0])
+            main = torch.cuda.current_stream() if streams else None
             adelic_outputs = {}
-            for p in self.primes:
-                H_p = [h.clone() for h in H]
-                for adelic_layer in self.adelic_branches[str(p)]:
-                    H_p = adelic_layer(H_p, complex)
-                adelic_outputs[p] = H_p
+            for i, p in enumerate(self.primes):
+                if streams:
+                    streams[i].wait_stream(main)
+                    with torch.cuda.stream(streams[i]):
+                        adelic_outputs[p] = self._adelic_branch(p, H, complex)
+                    for h in adelic_outputs[p]:
+                        h.record_stream(main)
+                else:
+                    adelic_outputs[p] = self._adelic_branch(p, H, complex)
+            if streams:
+                for stream in streams:
+                    main.wait_stream(stream)
             
             # Fiber product binding (combine archimedean + p-adic branches)
             # For simplicity, concatenate and project at level 0
@@ -770,11 +1360,29 @@ class SFNO_UD(nn.Module):
         
         return outputs, intermediate
     
+    def _adelic_branch(self, p: int, H: List[Tensor], complex: SimplicialComplex) -> List[Tensor]:
+        """Run the p-adic branch on H (layers never modify their inputs in place)."""
+        H_p = list(H)
+        for adelic_layer in self.adelic_branches[str(p)]:
+            H_p = adelic_layer(H_p, complex)
+        return H_p
+    
+    def _adelic_streams(self, H_0: Tensor) -> Optional[List['torch.cuda.Stream']]:
+        """One side CUDA stream per prime, created on first CUDA forward."""
+        if not H_0.is_cuda:
+            return None
+        per_device = _ADELIC_STREAMS.setdefault(self, {})
+        if H_0.device not in per_device:
+            per_device[H_0.device] = [torch.cuda.Stream(device=H_0.device)
+                                      for _ in self.primes]
+        return per_device[H_0.device]
+    
     def _tropicalize(self, X: Tensor) -> Tensor:
         """Apply tropical (hard) attention: softmax → argmax."""
-        # For output, apply argmax along feature dimension
-        idx = X.argmax(dim=-1, keepdim=True)
-        return torch.zeros_like(X).scatter_(-1, idx, 1.0) * X.max(dim=-1, keepdim=True)[0]
+        # Keep only the max along the feature dimension: one max pass
+        # supplies both the index and the value scattered into place
+        max_vals, idx = X.max(dim=-1, keepdim=True)
+        return torch.zeros_like(X).scatter_(-1, idx, max_vals)
 
 
 # =============================================================================
@@ -800,6 +1408,19 @@ class SFNOLoss(nn.Module):
         self.alpha = alpha_spectral
         self.beta = beta_boundary
         self.gamma = gamma_incompleteness
+        self._filter_groups = None  # (model, spectral filters grouped by shape)
+    
+    def _spectral_filter_groups(self, model: 'SFNO_UD') -> List[List[Tensor]]:
+        """Learned spectral filters of model, grouped by shape; built once per model."""
+        if self._filter_groups is None or self._filter_groups[0] is not model:
+            groups: Dict[torch.Size, List[Tensor]] = {}
+            for layer in model.layers:
+                for spec_conv in layer.spectral_convs:
+                    if hasattr(spec_conv, 'spectral_filter') and spec_conv.spectral_filter.shape[0] > 1:
+                        groups.setdefault(spec_conv.spectral_filter.shape, []).append(
+                            spec_conv.spectral_filter)
+            self._filter_groups = (model, list(groups.values()))
+        return self._filter_groups[1]
     
     def forward(
         self,
@@ -820,6 +1441,7 @@ class SFNOLoss(nn.Module):
         
         # Task loss (cross-entropy or MSE depending on task)
         task_loss = 0.0
+        mse_pairs = []
         for k, (pred, target) in enumerate(zip(predictions, targets)):
             if pred.numel() > 0 and target.numel() > 0:
                 if target.dtype == torch.long:
@@ -828,32 +1450,36 @@ class SFNOLoss(nn.Module):
                         target.view(-1)
                     )
                 else:
-                    task_loss += F.mse_loss(pred, target)
+                    mse_pairs.append((pred, target))
+        if mse_pairs and all(p.shape == mse_pairs[0][0].shape and t.shape == p.shape
+                             for p, t in mse_pairs):
+            # Same-shape levels: one batched MSE, per-level means summed
+            preds = torch.stack([p for p, _ in mse_pairs])
+            targs = torch.stack([t for _, t in mse_pairs])
+            task_loss += ((preds - targs) ** 2).flatten(1).mean(dim=1).sum()
+        else:
+            for pred, target in mse_pairs:
+                task_loss += F.mse_loss(pred, target)
         losses['task'] = task_loss
         
-        # Spectral regularization: encourage smooth spectral filters
+        # Spectral regularization: encourage smooth spectral filters.
+        # Penalize rapid variation across modes; same-shape filters are
+        # stacked so each group is one diff/square/mean
         spectral_loss = 0.0
-        for layer in model.layers:
-            for spec_conv in layer.spectral_convs:
-                if hasattr(spec_conv, 'spectral_filter'):
-                    # Penalize rapid variation in spectral filter
-                    filt = spec_conv.spectral_filter
-                    if filt.shape[0] > 1:
-                        diff = filt[1:] - filt[:-1]
-                        spectral_loss += (diff ** 2).mean()
+        for group in self._spectral_filter_groups(model):
+            filters = torch.stack(group)  # [n_filters, n_modes, in, out]
+            diff = filters[:, 1:] - filters[:, :-1]
+            spectral_loss += (diff ** 2).mean(dim=(1, 2, 3)).sum()
         losses['spectral'] = spectral_loss
         
-        # Boundary consistency: ∂∘∂ = 0 should be preserved
+        # Boundary consistency: ∂∘∂ = 0 should be preserved. The boundaries
+        # are fixed, so ‖∂_k ∘ ∂_{k+1}‖² is a per-complex constant (cached)
         boundary_loss = 0.0
         if intermediate is not None and 'layer_0' in intermediate:
             for k in range(1, len(predictions)):
                 if k < len(complex.boundary_matrices) - 1:
-                    B_k = complex.boundary_matrices[k]
-                    B_kp1 = complex.boundary_matrices[k+1]
-                    if B_k is not None and B_kp1 is not None:
-                        # Check ∂_k ∘ ∂_{k+1} ≈ 0
-                        composition = B_k @ B_kp1
-                        boundary_loss += (composition ** 2).mean()
+                    boundary_loss += complex.boundary_consistency(k)
+            boundary_loss = torch.tensor(boundary_loss, device=predictions[0].device)
         losses['boundary'] = boundary_loss
         
         # Incompleteness penalty: penalize variance on boundary
@@ -891,9 +1517,10 @@ def compute_attention_skeleton(
     Following Definition 3.10 from Day 3:
     Skel(A) = {(i,j) : A_ij = max_k A_ik}
     """
-    max_attention = attention_matrix.max(dim=-1, keepdim=True)[0]
-    skeleton = (attention_matrix >= max_attention - threshold).float()
-    return skeleton
+    # Threshold subtracted in place on the [.., 1] row maxima, so the only
+    # full-size pass besides the reduction is the comparison itself
+    cutoff = attention_matrix.amax(dim=-1, keepdim=True).sub_(threshold)
+    return torch.ge(attention_matrix, cutoff).float()
 
 
 def compute_spectral_bias(
@@ -921,16 +1548,44 @@ def compute_spectral_bias(
 
 
 def estimate_betti_numbers(
-    hodge_laplacian: Tensor,
+    hodge_laplacian: Union[Tensor, sparse.spmatrix],
     tol: float = 1e-6
 ) -> int:
     """
     Estimate Betti number as dimension of Laplacian kernel.
     
-    By Theorem 2.2: β_k = dim ker(L_k)
+    By Theorem 2.2: β_k = dim ker(L_k). Since L_k is PSD this is the number
+    of eigenvalues below tol, read off (Sylvester's law of inertia) as the
+    negative pivots of a sparse symmetric LU of L_k - tol·I in float64,
+    with no eigendecomposition. Accepts dense or sparse torch tensors and
+    SciPy sparse matrices.
     """
-    eigenvalues = torch.linalg.eigvalsh(hodge_laplacian)
-    return int((eigenvalues.abs() < tol).sum().item())
+    if isinstance(hodge_laplacian, Tensor):
+        L = hodge_laplacian.detach().cpu()
+        if L.layout != torch.strided:
+            L = L.to_sparse_coo().coalesce()
+            indices = L.indices().numpy()
+            L = sparse.coo_matrix((L.values().double().numpy(), (indices[0], indices[1])),
+                                  shape=L.shape)
+        else:
+            L = L.double().numpy()
+    else:
+        L = hodge_laplacian
+    
+    n = L.shape[0]
+    if n == 0:
+        return 0
+    A = sparse.csc_matrix(L, dtype=np.float64) - tol * sparse.identity(n, format='csc')
+    try:
+        # Symmetric mode: pivots stay on the (symmetrically permuted) diagonal,
+        # so the signs of U's diagonal are the inertia of L - tol·I
+        lu = splu(A, permc_spec='MMD_AT_PLUS_A', diag_pivot_thresh=0.0,
+                  options=dict(SymmetricMode=True))
+        return int((lu.U.diagonal() < 0).sum())
+    except RuntimeError:
+        # Exactly singular shifted matrix (eigenvalue at tol): fall back to dense
+        eigenvalues = np.linalg.eigvalsh(A.toarray() + tol * np.eye(n))
+        return int((np.abs(eigenvalues) < tol).sum())
 
 
 # =============================================================================
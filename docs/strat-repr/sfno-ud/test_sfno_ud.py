@@ -0,0 +1,100 @@
+"""
+Regression tests for S-FNO-UD.
+
+Run from this directory with: python -m unittest test_sfno_ud
+"""
+
+import copy
+import io
+import threading
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+import torch
+from scipy.sparse.linalg import lobpcg
+
+import sfno_ud
+from sfno_ud import _ADELIC_STREAMS, SimplicialComplex, SFNO_UD, SFNOLayer
+
+
+def _small_complex() -> SimplicialComplex:
+    torch.manual_seed(0)
+    edge_index = torch.randint(0, 12, (2, 30))
+    return SimplicialComplex.from_graph(edge_index, 12, max_spectral_modes=8)
+
+
+class TestModelSerialization(unittest.TestCase):
+    """Models must stay copyable/picklable after they have seen a complex."""
+
+    def setUp(self):
+        self.complex = _small_complex()
+        self.model = SFNO_UD([5, 4, 3], [16, 12, 8], [2, 1, 1], n_layers=2,
+                             n_modes=[8, 6, 4], use_adelic=True).eval()
+        self.X = [torch.randn(2, n, d) for n, d in zip(self.complex.n_simplices, [5, 4, 3])]
+        self.Y, _ = self.model(self.X, self.complex)
+
+    def test_deepcopy_after_forward(self):
+        model_copy = copy.deepcopy(self.model)
+        Y_copy, _ = model_copy(self.X, self.complex)
+        for a, b in zip(self.Y, Y_copy):
+            torch.testing.assert_close(a, b)
+
+    def test_save_after_forward(self):
+        buffer = io.BytesIO()
+        torch.save(self.model, buffer)
+        buffer.seek(0)
+        model_loaded = torch.load(buffer, weights_only=False)
+        Y_loaded, _ = model_loaded(self.X, self.complex)
+        for a, b in zip(self.Y, Y_loaded):
+            torch.testing.assert_close(a, b)
+
+    def test_adelic_streams_stay_off_module(self):
+        # Stand-in for the per-prime CUDA streams: equally unpicklable
+        _ADELIC_STREAMS[self.model] = {torch.device('cuda', 0): [threading.Lock()]}
+        try:
+            model_copy = copy.deepcopy(self.model)
+            torch.save(self.model, io.BytesIO())
+            self.assertNotIn(model_copy, _ADELIC_STREAMS)
+        finally:
+            del _ADELIC_STREAMS[self.model]
+
+
+class TestEigendecomposition(unittest.TestCase):
+
+    def test_unconverged_lobpcg_falls_back_to_eigh(self):
+        torch.manual_seed(0)
+        complex = SimplicialComplex.from_graph(torch.randint(0, 120, (2, 300)), 120,
+                                               max_spectral_modes=6)
+        
+        def stalled_lobpcg(*args, **kwargs):
+            kwargs['maxiter'] = 1
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                return lobpcg(*args, **kwargs)
+        
+        with mock.patch.object(sfno_ud, 'lobpcg', stalled_lobpcg):
+            decompositions = complex._compute_eigendecompositions()
+        for L_k, (Lambda_k, _) in zip(complex.sparse_laplacians, decompositions):
+            expected = np.linalg.eigvalsh(L_k.toarray())[:len(Lambda_k)]
+            np.testing.assert_allclose(Lambda_k.numpy(), expected, atol=1e-5)
+
+
+class TestCheckpointCompatibility(unittest.TestCase):
+
+    def test_legacy_alpha_keys_load(self):
+        layer = SFNOLayer([4, 4, 4], [4, 4, 4])
+        state = layer.state_dict()
+        alpha = torch.tensor([0.5, 1.5, 2.5])
+        del state['alpha']
+        for k, value in enumerate(alpha):
+            state[f'alpha.{k}'] = value.clone()
+        
+        restored = SFNOLayer([4, 4, 4], [4, 4, 4])
+        restored.load_state_dict(state)
+        torch.testing.assert_close(restored.alpha.detach(), alpha)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the Spectral Cathedral helpers.
+
+Run from this directory with: python -m unittest test_visualization
+"""
+
+import unittest
+
+import numpy as np
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import visualization
+from visualization import (
+    HAS_NUMBA,
+    TROPICAL_TEMPERATURE,
+    SpectralCathedralStatic,
+    VisualizationConfig,
+    _temperature_sweep_numpy,
+    temperature_sweep,
+)
+
+
+class TestTemperatureSweep(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.logits = rng.standard_normal((6, 9))
+        self.temperatures = np.array([2.0, 1.0, 0.1, 1e-3, TROPICAL_TEMPERATURE / 2, 0.0])
+
+    def test_matches_softmax(self):
+        frames = temperature_sweep(self.logits, self.temperatures[:3])
+        for T, frame in zip(self.temperatures[:3], frames):
+            e = np.exp(self.logits / T - (self.logits / T).max(axis=-1, keepdims=True))
+            np.testing.assert_allclose(frame, e / e.sum(axis=-1, keepdims=True), rtol=1e-10)
+
+    def test_tropical_limit_is_argmax(self):
+        hard = np.zeros_like(self.logits)
+        hard[np.arange(len(self.logits)), self.logits.argmax(axis=-1)] = 1.0
+        for frames in (temperature_sweep(self.logits, self.temperatures),
+                       _temperature_sweep_numpy(self.logits, self.temperatures)):
+            np.testing.assert_array_equal(frames[-2], hard)
+            np.testing.assert_array_equal(frames[-1], hard)
+
+    @unittest.skipUnless(HAS_NUMBA, "numba not installed")
+    def test_numba_matches_numpy(self):
+        np.testing.assert_allclose(
+            visualization._temperature_sweep_numba(self.logits, self.temperatures),
+            _temperature_sweep_numpy(self.logits, self.temperatures),
+            rtol=1e-10, atol=1e-12
+        )
+
+    def test_degeneration_frames(self):
+        static = SpectralCathedralStatic(VisualizationConfig(fps=4, duration=2.0))
+        temperatures, frames = static.tropical_degeneration_frames(self.logits)
+        self.assertEqual(frames.shape, (8,) + self.logits.shape)
+        self.assertEqual(temperatures[0], 1.0)
+        self.assertEqual(temperatures[-1], 0.0)
+        np.testing.assert_allclose(frames.sum(axis=-1), 1.0)
+
+
+class TestStyle(unittest.TestCase):
+
+    def test_style_is_scoped_to_drawing(self):
+        plt.rcParams['lines.linewidth'] = 3.25
+        try:
+            static = SpectralCathedralStatic(VisualizationConfig(style='dark'))
+            self.assertEqual(plt.rcParams['figure.facecolor'], 'white')
+            fig, _ = static.plot_hodge_spectrum_cathedral(np.array([0.0, 0.5, 1.0, 2.0]))
+            self.assertEqual(fig.get_facecolor(), (0.0, 0.0, 0.0, 1.0))
+            self.assertEqual(plt.rcParams['figure.facecolor'], 'white')
+            self.assertEqual(plt.rcParams['lines.linewidth'], 3.25)
+            plt.close(fig)
+        finally:
+            plt.rcParams['lines.linewidth'] = matplotlib.rcParamsDefault['lines.linewidth']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -323,7 +323,7 @@ class SFNOTrainer:
                     filt = layer.spectral_convs[k].spectral_filter
                     
                     # Compute effective kernel eigenvalue
-                    kappa = (filt ** 2).sum(dim=(1, 2)).cpu().numpy()
+                    kappa = (filt.float() ** 2).sum(dim=(1, 2)).cpu().numpy()
                     
                     # Separate harmonic (λ ≈ 0) and non-harmonic modes
                     Lambda_np = Lambda_k.cpu().numpy()
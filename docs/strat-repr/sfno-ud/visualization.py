@@ -24,7 +24,9 @@ Version: 1.0
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Union
+import contextlib
+import functools
 import json
 from dataclasses import dataclass
 
@@ -40,12 +42,18 @@ except ImportError:
 try:
     import matplotlib.pyplot as plt
     import matplotlib.patches as mpatches
-    from matplotlib.collections import LineCollection, PatchCollection
+    from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
     from mpl_toolkits.mplot3d import Axes3D
     HAS_MATPLOTLIB = True
 except ImportError:
     HAS_MATPLOTLIB = False
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 try:
     import plotly.graph_objects as go
     import plotly.express as px
@@ -81,28 +89,149 @@ class VisualizationConfig:
     # Animation
     fps: int = 30
     duration: float = 5.0
+    
+    # Output (zlib level 1 encodes ~3x faster than the default 6 for ~15% larger PNGs)
+    png_compress_level: int = 1
+    jpeg_quality: int = 90
+
+
+@dataclass
+class HodgeSpectrumView:
+    """
+    Eigenvalues of one Hodge level with their harmonic summary precomputed.
+    
+    Build once per spectrum (e.g. once per epoch) and pass to every plotting
+    entry point instead of the raw array so the λ < 1e-6 mask, β_k, spectral
+    gap and max are not recomputed by each visualizer.
+    """
+    
+    eigenvalues: np.ndarray
+    harmonic_mask: np.ndarray
+    n_harmonic: int
+    emax: float
+    spectral_gap: Optional[float]
+    
+    @classmethod
+    def from_eigenvalues(cls, eigenvalues: np.ndarray) -> 'HodgeSpectrumView':
+        eigenvalues = np.asarray(eigenvalues)
+        harmonic_mask = eigenvalues < 1e-6
+        n_harmonic = int(harmonic_mask.sum())
+        return cls(
+            eigenvalues=eigenvalues,
+            harmonic_mask=harmonic_mask,
+            n_harmonic=n_harmonic,
+            emax=float(eigenvalues.max()),
+            spectral_gap=(float(eigenvalues[~harmonic_mask].min())
+                          if n_harmonic < len(eigenvalues) else None)
+        )
+
+
+SpectrumLike = Union[np.ndarray, HodgeSpectrumView]
+
+
+def as_spectrum_view(spectrum: SpectrumLike) -> HodgeSpectrumView:
+    """Wrap raw eigenvalues in a HodgeSpectrumView; pass views through."""
+    if isinstance(spectrum, HodgeSpectrumView):
+        return spectrum
+    return HodgeSpectrumView.from_eigenvalues(spectrum)
+
+
+# Temperatures below this are treated as the tropical limit: rows collapse to
+# a one-hot argmax (Theorem 3.2) instead of dividing by a vanishing T.
+TROPICAL_TEMPERATURE = 1e-6
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, fastmath=True)
+    def _temperature_sweep_numba(logits, temperatures):
+        n_temps = temperatures.shape[0]
+        n_q, n_k = logits.shape
+        out = np.zeros((n_temps, n_q, n_k))
+        for t in numba.prange(n_temps):
+            temp = temperatures[t]
+            for q in range(n_q):
+                row = logits[q]
+                if temp < TROPICAL_TEMPERATURE:
+                    out[t, q, np.argmax(row)] = 1.0
+                    continue
+                e = np.exp((row - row.max()) / temp)
+                out[t, q, :] = e / e.sum()
+        return out
+
+
+def temperature_sweep(logits: np.ndarray, temperatures: np.ndarray) -> np.ndarray:
+    """
+    Compute softmax(logits / T) for every temperature in one pass.
+    
+    Returns a (T, Q, K) stack of attention frames, e.g. the
+    config.fps * config.duration frames of a tropical degeneration
+    animation. Uses a compiled Numba kernel when numba is installed.
+    """
+    logits = np.ascontiguousarray(logits, dtype=np.float64)
+    temperatures = np.ascontiguousarray(temperatures, dtype=np.float64)
+    
+    if HAS_NUMBA:
+        return _temperature_sweep_numba(logits, temperatures)
+    return _temperature_sweep_numpy(logits, temperatures)
+
+
+def _temperature_sweep_numpy(logits: np.ndarray, temperatures: np.ndarray) -> np.ndarray:
+    """Broadcast NumPy fallback of temperature_sweep (same T→0 argmax clamp)."""
+    tropical = temperatures < TROPICAL_TEMPERATURE
+    safe_t = np.where(tropical, 1.0, temperatures)[:, None, None]
+    e = np.exp((logits - logits.max(axis=-1, keepdims=True))[None] / safe_t)
+    frames = e / e.sum(axis=-1, keepdims=True)
+    
+    if tropical.any():
+        hard = np.zeros_like(logits)
+        hard[np.arange(logits.shape[0]), logits.argmax(axis=-1)] = 1.0
+        frames[tropical] = hard
+    return frames
 
 
 # =============================================================================
 # PART II: Static Visualizations (Matplotlib)
 # =============================================================================
 
+# Matplotlib stylesheet per VisualizationConfig.style ('seaborn-paper' was
+# renamed to 'seaborn-v0_8-paper' in matplotlib 3.6)
+_MPL_STYLESHEETS = {
+    'dark': 'dark_background',
+    'paper': 'seaborn-v0_8-paper',
+}
+
+
+def _styled(method):
+    """Draw under the config's stylesheet without touching global rcParams."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stylesheet = _MPL_STYLESHEETS.get(self.config.style) if HAS_MATPLOTLIB else None
+        context = plt.style.context(stylesheet) if stylesheet else contextlib.nullcontext()
+        with context:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class SpectralCathedralStatic:
     """Static visualizations using matplotlib."""
     
     def __init__(self, config: Optional[VisualizationConfig] = None):
         self.config = config or VisualizationConfig()
-        
-        if HAS_MATPLOTLIB:
-            # Set style
-            if self.config.style == 'dark':
-                plt.style.use('dark_background')
-            elif self.config.style == 'paper':
-                plt.style.use('seaborn-paper')
     
+    def _savefig(self, save_path: str):
+        """Save the current figure (str or pathlib.Path), tuning the encoder by file suffix."""
+        if str(save_path).lower().endswith(('.jpg', '.jpeg')):
+            pil_kwargs = {'quality': self.config.jpeg_quality}
+        else:
+            pil_kwargs = {'compress_level': self.config.png_compress_level,
+                          'optimize': False}
+        plt.savefig(save_path, dpi=self.config.dpi, bbox_inches='tight',
+                    pil_kwargs=pil_kwargs)
+    
+    @_styled
     def plot_hodge_spectrum_cathedral(
         self,
-        eigenvalues: np.ndarray,
+        eigenvalues: SpectrumLike,
         level: int = 0,
         title: str = "Hodge Laplacian Spectrum",
         save_path: Optional[str] = None
@@ -112,6 +241,7 @@ class SpectralCathedralStatic:
         
         Harmonic modes (λ=0) are shown as golden spires.
         Non-harmonic modes form the supporting structure.
+        Accepts raw eigenvalues or a precomputed HodgeSpectrumView.
         """
         if not HAS_MATPLOTLIB:
             print("matplotlib not available")
@@ -119,18 +249,20 @@ class SpectralCathedralStatic:
         
         fig, ax = plt.subplots(figsize=self.config.figsize, dpi=self.config.dpi)
         
+        spectrum = as_spectrum_view(eigenvalues)
+        eigenvalues = spectrum.eigenvalues
         n_modes = len(eigenvalues)
         x = np.arange(n_modes)
         
         # Identify harmonic modes
-        harmonic_mask = eigenvalues < 1e-6
-        n_harmonic = harmonic_mask.sum()
+        harmonic_mask = spectrum.harmonic_mask
+        n_harmonic = spectrum.n_harmonic
         
         # Create cathedral-style bars
         # Harmonic modes as tall golden spires
         ax.bar(
             x[harmonic_mask],
-            np.ones(n_harmonic) * eigenvalues.max() * 1.5,
+            np.full(n_harmonic, spectrum.emax * 1.5),
             color=self.config.color_harmonic,
             alpha=0.8,
             width=0.8,
@@ -148,8 +280,8 @@ class SpectralCathedralStatic:
         )
         
         # Add spectral gap annotation
-        if (~harmonic_mask).any():
-            spectral_gap = eigenvalues[~harmonic_mask].min()
+        if spectrum.spectral_gap is not None:
+            spectral_gap = spectrum.spectral_gap
             ax.axhline(
                 y=spectral_gap,
                 color=self.config.color_boundary,
@@ -168,7 +300,7 @@ class SpectralCathedralStatic:
         )
         ax.legend(loc='upper right')
         ax.set_xlim(-0.5, n_modes - 0.5)
-        ax.set_ylim(0, eigenvalues.max() * 1.7)
+        ax.set_ylim(0, spectrum.emax * 1.7)
         
         # Grid like cathedral windows
         ax.grid(True, alpha=0.2, linestyle='-.')
@@ -176,10 +308,11 @@ class SpectralCathedralStatic:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.config.dpi, bbox_inches='tight')
+            self._savefig(save_path)
         
         return fig, ax
     
+    @_styled
     def plot_simplicial_complex_2d(
         self,
         vertices: np.ndarray,
@@ -200,16 +333,15 @@ class SpectralCathedralStatic:
         
         fig, ax = plt.subplots(figsize=self.config.figsize, dpi=self.config.dpi)
         
-        # Draw triangles (2-simplices)
+        # Draw triangles (2-simplices) as a single collection artist
         if triangles:
-            for tri in triangles:
-                triangle = plt.Polygon(
-                    vertices[list(tri)],
-                    facecolor=self.config.color_tropical,
-                    edgecolor='none',
-                    alpha=0.3
-                )
-                ax.add_patch(triangle)
+            tri_arr = np.asarray(triangles, dtype=np.int64)  # (T, 3)
+            ax.add_collection(PolyCollection(
+                vertices[tri_arr, :2],
+                facecolors=self.config.color_tropical,
+                edgecolors='none',
+                alpha=0.3
+            ))
         
         # Draw edges (1-simplices)
         for edge in edges:
@@ -253,10 +385,29 @@ class SpectralCathedralStatic:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.config.dpi, bbox_inches='tight')
+            self._savefig(save_path)
         
         return fig, ax
     
+    def tropical_degeneration_frames(
+        self,
+        logits: np.ndarray,
+        t_max: float = 1.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Attention frames annealed from T = t_max down to the tropical limit.
+        
+        Returns (temperatures, frames) with config.fps * config.duration
+        geometrically spaced temperatures ending at T = 0 (one-hot argmax),
+        and frames of shape (n_frames, Q, K) from temperature_sweep.
+        """
+        n_frames = max(2, int(round(self.config.fps * self.config.duration)))
+        temperatures = np.append(
+            np.geomspace(t_max, t_max * 1e-3, n_frames - 1), 0.0
+        )
+        return temperatures, temperature_sweep(logits, temperatures)
+    
+    @_styled
     def plot_tropical_degeneration(
         self,
         soft_attention: np.ndarray,
@@ -315,10 +466,11 @@ class SpectralCathedralStatic:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.config.dpi, bbox_inches='tight')
+            self._savefig(save_path)
         
         return fig, axes
     
+    @_styled
     def plot_spectral_bias_evolution(
         self,
         epochs: List[int],
@@ -374,10 +526,11 @@ class SpectralCathedralStatic:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.config.dpi, bbox_inches='tight')
+            self._savefig(save_path)
         
         return fig, ax
     
+    @_styled
     def plot_persistent_homology(
         self,
         birth_death: List[Tuple[float, float]],
@@ -432,7 +585,7 @@ class SpectralCathedralStatic:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.config.dpi, bbox_inches='tight')
+            self._savefig(save_path)
         
         return fig, axes
 
@@ -441,6 +594,63 @@ class SpectralCathedralStatic:
 # PART III: Interactive Visualizations (Plotly)
 # =============================================================================
 
+# Browsers choke on SVG/bar charts with tens of thousands of marks, so spectra
+# handed to the interactive and web front-ends are capped at this many bars.
+MAX_SPECTRUM_BARS = 5000
+
+
+def downsample_spectrum(
+    eigenvalues: SpectrumLike,
+    max_bars: int = MAX_SPECTRUM_BARS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduce a spectrum to at most max_bars bars for rendering.
+    
+    Harmonic modes (λ < 1e-6) are kept exactly; the non-harmonic tail is
+    averaged over contiguous buckets. Returns (x, y, harmonic_mask) where
+    x holds the (mean) mode index of each bar. Use this server-side before
+    passing eigenvalues to the SpectralCathedral React component.
+    """
+    spectrum = as_spectrum_view(eigenvalues)
+    eigenvalues = spectrum.eigenvalues
+    x = np.arange(len(eigenvalues), dtype=float)
+    harmonic_mask = spectrum.harmonic_mask
+    
+    n_tail = len(eigenvalues) - spectrum.n_harmonic
+    n_buckets = max(max_bars - (len(eigenvalues) - n_tail), 1)
+    if len(eigenvalues) <= max_bars or n_tail <= n_buckets:
+        return x, eigenvalues, harmonic_mask
+    
+    starts = np.linspace(0, n_tail, n_buckets + 1).astype(int)
+    counts = np.diff(starts)
+    starts = starts[:-1]
+    y_tail = np.add.reduceat(eigenvalues[~harmonic_mask], starts) / counts
+    x_tail = np.add.reduceat(x[~harmonic_mask], starts) / counts
+    
+    return (
+        np.concatenate([x[harmonic_mask], x_tail]),
+        np.concatenate([eigenvalues[harmonic_mask], y_tail]),
+        np.concatenate([np.ones(len(eigenvalues) - n_tail, dtype=bool),
+                        np.zeros(n_buckets, dtype=bool)])
+    )
+
+
+def plotly_header() -> str:
+    """
+    Return the single plotly.js <script> tag for a multi-figure page.
+    
+    Include this once in the page head and render every figure with
+    include_plotlyjs=False, full_html=False so plotly.js is fetched once.
+    """
+    if not HAS_PLOTLY:
+        return ''
+    from plotly.offline import get_plotlyjs_version
+    return (
+        f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js" '
+        'charset="utf-8"></script>'
+    )
+
+
 class SpectralCathedralInteractive:
     """Interactive visualizations using Plotly."""
     
@@ -449,13 +659,19 @@ class SpectralCathedralInteractive:
     
     def create_spectrum_explorer(
         self,
-        eigenvalues_by_level: Dict[int, np.ndarray],
-        title: str = "Hodge Spectrum Explorer"
+        eigenvalues_by_level: Dict[int, SpectrumLike],
+        title: str = "Hodge Spectrum Explorer",
+        include_plotlyjs: Union[bool, str] = 'cdn',
+        full_html: bool = True,
+        max_bars: int = MAX_SPECTRUM_BARS
     ) -> Optional[str]:
         """
         Create interactive spectrum explorer with level selection.
         
-        Returns HTML string for embedding.
+        Returns HTML string for embedding. When embedding several figures
+        on one page, pass include_plotlyjs=False, full_html=False and emit
+        plotly_header() once instead. Levels with more than max_bars modes
+        are downsampled (see downsample_spectrum) and the title says so.
         """
         if not HAS_PLOTLY:
             print("plotly not available")
@@ -466,17 +682,29 @@ class SpectralCathedralInteractive:
         
         # Add traces for each level
         buttons = []
-        for level, eigenvalues in eigenvalues_by_level.items():
-            n_harmonic = (eigenvalues < 1e-6).sum()
+        level_titles = []
+        n_levels = len(eigenvalues_by_level)
+        for idx, (level, spectrum) in enumerate(eigenvalues_by_level.items()):
+            spectrum = as_spectrum_view(spectrum)
+            x, y, harmonic_mask = downsample_spectrum(spectrum, max_bars)
+            n_harmonic = spectrum.n_harmonic
+            emax = spectrum.emax
+            n_modes = len(spectrum.eigenvalues)
             
-            visible = [False] * len(eigenvalues_by_level) * 2
-            visible[level * 2] = True
-            visible[level * 2 + 1] = True
+            level_title = title
+            if len(y) < n_modes:
+                level_title = (f'{title} (level {level} downsampled from '
+                               f'{n_modes} to {len(y)} modes)')
+            level_titles.append(level_title)
+            
+            # Each level owns two consecutive traces (harmonic, non-harmonic)
+            visible = np.zeros(2 * n_levels, dtype=bool)
+            visible[2 * idx:2 * idx + 2] = True
             
             # Harmonic modes
             fig.add_trace(go.Bar(
-                x=list(range(len(eigenvalues))),
-                y=np.where(eigenvalues < 1e-6, eigenvalues.max() * 1.5, 0),
+                x=x[harmonic_mask],
+                y=np.full(n_harmonic, emax * 1.5),
                 name=f'Harmonic (k={level})',
                 marker_color=self.config.color_harmonic,
                 visible=(level == 0)
@@ -484,8 +712,8 @@ class SpectralCathedralInteractive:
             
             # Non-harmonic modes
             fig.add_trace(go.Bar(
-                x=list(range(len(eigenvalues))),
-                y=np.where(eigenvalues >= 1e-6, eigenvalues, 0),
+                x=x[~harmonic_mask],
+                y=y[~harmonic_mask],
                 name=f'Non-harmonic (k={level})',
                 marker_color=self.config.color_nonharmonic,
                 visible=(level == 0)
@@ -494,7 +722,7 @@ class SpectralCathedralInteractive:
             buttons.append(dict(
                 label=f'Level k={level} (β_{level}={n_harmonic})',
                 method='update',
-                args=[{'visible': visible}]
+                args=[{'visible': visible.tolist()}, {'title': level_title}]
             ))
         
         # Add dropdown
@@ -506,25 +734,28 @@ class SpectralCathedralInteractive:
                 y=1.15,
                 buttons=buttons
             )],
-            title=title,
+            title=level_titles[0] if level_titles else title,
             xaxis_title='Mode Index',
             yaxis_title='Eigenvalue λ',
             barmode='overlay',
             template='plotly_dark' if self.config.style == 'dark' else 'plotly'
         )
         
-        return fig.to_html(include_plotlyjs='cdn')
+        return fig.to_html(include_plotlyjs=include_plotlyjs, full_html=full_html)
     
     def create_attention_flow_3d(
         self,
         attention_matrix: np.ndarray,
         positions: Optional[np.ndarray] = None,
-        title: str = "Attention Flow (3D)"
+        title: str = "Attention Flow (3D)",
+        include_plotlyjs: Union[bool, str] = 'cdn',
+        full_html: bool = True
     ) -> Optional[str]:
         """
         Create 3D visualization of attention flow.
         
         Nodes are positioned in 3D space, edges show attention weights.
+        See create_spectrum_explorer for the include_plotlyjs/full_html options.
         """
         if not HAS_PLOTLY:
             print("plotly not available")
@@ -542,17 +773,16 @@ class SpectralCathedralInteractive:
             ])
         
         # Create edges
-        edge_x, edge_y, edge_z = [], [], []
-        edge_colors = []
-        
         threshold = 0.1  # Only show significant attention
-        for i in range(n):
-            for j in range(n):
-                if attention_matrix[i, j] > threshold:
-                    edge_x.extend([positions[i, 0], positions[j, 0], None])
-                    edge_y.extend([positions[i, 1], positions[j, 1], None])
-                    edge_z.extend([positions[i, 2], positions[j, 2], None])
-                    edge_colors.append(attention_matrix[i, j])
+        ii, jj = np.nonzero(attention_matrix > threshold)
+        edge_colors = attention_matrix[ii, jj]
+        
+        # Interleave (source, target, NaN) so Plotly breaks the line per edge
+        sep = np.full(ii.size, np.nan)
+        edge_x, edge_y, edge_z = (
+            np.stack([positions[ii, d], positions[jj, d], sep], axis=1).ravel()
+            for d in range(3)
+        )
         
         # Create figure
         fig = go.Figure()
@@ -591,24 +821,21 @@ class SpectralCathedralInteractive:
             template='plotly_dark' if self.config.style == 'dark' else 'plotly'
         )
         
-        return fig.to_html(include_plotlyjs='cdn')
+        return fig.to_html(include_plotlyjs=include_plotlyjs, full_html=full_html)
 
 
 # =============================================================================
 # PART IV: React Component Generation
 # =============================================================================
 
-def generate_react_spectrum_component() -> str:
-    """
-    Generate a React component for interactive spectrum visualization.
-    
-    Uses D3.js for rendering within React.
-    """
-    return '''
+# Component sources are static, so they live as module constants and the
+# generator functions hand back the same string object on every call.
+
+_REACT_SPECTRUM_COMPONENT = '''
 import React, { useEffect, useRef, useState } from 'react';
 import * as d3 from 'd3';
 
-const SpectralCathedral = ({ eigenvalues, level = 0, width = 800, height = 500 }) => {
+const SpectralCathedral = ({ eigenvalues, harmonicMask = null, level = 0, width = 800, height = 500 }) => {
   const svgRef = useRef();
   const [selectedMode, setSelectedMode] = useState(null);
   
@@ -637,8 +864,8 @@ const SpectralCathedral = ({ eigenvalues, level = 0, width = 800, height = 500 }
       .domain([0, maxVal])
       .range([innerHeight, 0]);
     
-    // Identify harmonic modes
-    const isHarmonic = eigenvalues.map(e => e < 1e-6);
+    // Identify harmonic modes (reuse the server-side mask when provided)
+    const isHarmonic = harmonicMask || eigenvalues.map(e => e < 1e-6);
     const nHarmonic = isHarmonic.filter(h => h).length;
     
     // Draw bars
@@ -693,7 +920,7 @@ const SpectralCathedral = ({ eigenvalues, level = 0, width = 800, height = 500 }
       .attr("text-anchor", "middle")
       .text("Eigenvalue λ");
     
-  }, [eigenvalues, level, width, height]);
+  }, [eigenvalues, harmonicMask, level, width, height]);
   
   return (
     <div className="spectral-cathedral">
@@ -712,11 +939,7 @@ export default SpectralCathedral;
 '''
 
 
-def generate_react_attention_component() -> str:
-    """
-    Generate a React component for attention visualization.
-    """
-    return '''
+_REACT_ATTENTION_COMPONENT = '''
 import React, { useEffect, useRef, useState } from 'react';
 import * as d3 from 'd3';
 
@@ -822,26 +1045,27 @@ export default AttentionHeatmap;
 '''
 
 
+def generate_react_spectrum_component() -> str:
+    """
+    Generate a React component for interactive spectrum visualization.
+    
+    Uses D3.js for rendering within React.
+    """
+    return _REACT_SPECTRUM_COMPONENT
+
+
+def generate_react_attention_component() -> str:
+    """
+    Generate a React component for attention visualization.
+    """
+    return _REACT_ATTENTION_COMPONENT
+
+
 # =============================================================================
 # PART V: Export Functions
 # =============================================================================
 
-def export_visualization_suite(output_dir: str = './visualizations'):
-    """
-    Export all visualization components and styles.
-    """
-    import os
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Export React components
-    with open(os.path.join(output_dir, 'SpectralCathedral.jsx'), 'w') as f:
-        f.write(generate_react_spectrum_component())
-    
-    with open(os.path.join(output_dir, 'AttentionHeatmap.jsx'), 'w') as f:
-        f.write(generate_react_attention_component())
-    
-    # Export CSS
-    css = '''
+_CATHEDRAL_CSS = '''
 .spectral-cathedral {
   font-family: 'Georgia', serif;
   background: linear-gradient(180deg, #1a1a2e 0%, #16213e 100%);
@@ -883,14 +1107,39 @@ def export_visualization_suite(output_dir: str = './visualizations'):
   margin-left: 10px;
 }
 '''
+
+
+def export_visualization_suite(output_dir: str = './visualizations', bundle: bool = False):
+    """
+    Export all visualization components and styles.
+    
+    Each file is assembled in memory and emitted with a single write. With
+    bundle=True the files are packed into one viz_bundle.zip instead.
+    """
+    import os
+    os.makedirs(output_dir, exist_ok=True)
+    
+    files = {
+        'SpectralCathedral.jsx': generate_react_spectrum_component(),
+        'AttentionHeatmap.jsx': generate_react_attention_component(),
+        'cathedral.css': _CATHEDRAL_CSS,
+    }
     
-    with open(os.path.join(output_dir, 'cathedral.css'), 'w') as f:
-        f.write(css)
+    if bundle:
+        import zipfile
+        bundle_path = os.path.join(output_dir, 'viz_bundle.zip')
+        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+            for name, text in files.items():
+                z.writestr(name, text)
+        print(f"Exported visualization suite to {bundle_path}")
+    else:
+        for name, text in files.items():
+            with open(os.path.join(output_dir, name), 'w', buffering=1 << 17) as f:
+                f.write(text)
+        print(f"Exported visualization suite to {output_dir}/")
     
-    print(f"Exported visualization suite to {output_dir}/")
-    print("  - SpectralCathedral.jsx")
-    print("  - AttentionHeatmap.jsx")
-    print("  - cathedral.css")
+    for name in files:
+        print(f"  - {name}")
 
 
 # =============================================================================
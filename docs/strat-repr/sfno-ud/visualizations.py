@@ -17,36 +17,116 @@ Author: Council of Luminaries Visualization Team
 
 import torch
 import numpy as np
+from scipy.special import softmax
 from typing import List, Tuple, Dict, Optional
 import json
+import base64
+import importlib.util
+import weakref
+from functools import lru_cache
 
-# Check for optional visualization dependencies
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as mpatches
-    from mpl_toolkits.mplot3d import Axes3D
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+# Check for optional visualization dependencies. matplotlib and plotly are
+# only located here; they are imported on first use (see _ensure_matplotlib /
+# _ensure_plotly) so export-only workflows never pay their import cost.
+HAS_MATPLOTLIB = importlib.util.find_spec('matplotlib') is not None
+HAS_PLOTLY = importlib.util.find_spec('plotly') is not None
+
+plt = mpatches = LineCollection = _RDBU = _BLUES = None
+go = make_subplots = None
 
 try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-    HAS_PLOTLY = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_PLOTLY = False
+    HAS_ORJSON = False
+
+
+def _ensure_matplotlib():
+    """Import matplotlib into module globals on first use."""
+    global plt, mpatches, LineCollection, _RDBU, _BLUES
+    if plt is None:
+        import matplotlib.pyplot as _plt
+        import matplotlib.patches as _mpatches
+        from matplotlib.collections import LineCollection as _LineCollection
+        mpatches, LineCollection = _mpatches, _LineCollection
+        # Colormaps resolved once instead of a registry lookup per plot
+        _RDBU = _plt.get_cmap('RdBu_r')
+        _BLUES = _plt.get_cmap('Blues')
+        plt = _plt
+
+
+def _ensure_plotly():
+    """Import plotly into module globals on first use."""
+    global go, make_subplots
+    if go is None:
+        from plotly.subplots import make_subplots as _make_subplots
+        import plotly.graph_objects as _go
+        make_subplots = _make_subplots
+        go = _go
+
+
+# =============================================================================
+# Host-side caches
+# =============================================================================
+
+# complex -> {level: (Lambda, U)} as numpy arrays; entries die with the complex
+_NP_EIG_CACHE = weakref.WeakKeyDictionary()
+
+
+def _np_eig(complex, level: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (eigenvalues, eigenvectors) of a level as numpy arrays.
+    
+    The device-to-host copy happens once per complex and level; every plot
+    and export after that reuses it. Treat the arrays as read-only.
+    """
+    per_complex = _NP_EIG_CACHE.setdefault(complex, {})
+    if level not in per_complex:
+        Lambda, U = complex.eigendecompositions[level]
+        # .float(): U_k may be stored as bfloat16, which NumPy cannot hold
+        per_complex[level] = (Lambda.cpu().float().numpy(), U.cpu().float().numpy())
+    return per_complex[level]
+
+
+@lru_cache(maxsize=32)
+def _circle_layout(n: int) -> np.ndarray:
+    """Unit-circle positions [n, 2] for n vertices (read-only, cached)."""
+    angles = np.linspace(0, 2*np.pi, n, endpoint=False)
+    pos = np.column_stack([np.cos(angles), np.sin(angles)])
+    pos.flags.writeable = False
+    return pos
+
+
+def _subplots(fig, ncols: int, figsize: Tuple[float, float]):
+    """
+    plt.subplots(1, ncols), or clear and resize an existing figure for reuse.
+    
+    Passing the same figure to successive plot calls skips figure setup.
+    """
+    if fig is None:
+        return plt.subplots(1, ncols, figsize=figsize)
+    fig.clear()
+    fig.set_size_inches(*figsize)
+    return fig, fig.subplots(1, ncols)
 
 
 # =============================================================================
 # PART I: Hodge Spectrum Visualization
 # =============================================================================
 
+# RGBA for harmonic (#e74c3c) and non-harmonic (#3498db) modes
+_SPECTRUM_PALETTE = np.array([
+    [0.906, 0.298, 0.235, 1.0],
+    [0.204, 0.596, 0.859, 1.0],
+])
+
+
 def plot_hodge_spectrum(
     complex,
     level: int = 0,
     show_gap: bool = True,
-    title: str = None
+    title: str = None,
+    fig=None
 ):
     """
     Visualize the Hodge Laplacian spectrum at a given simplicial level.
@@ -55,14 +135,14 @@ def plot_hodge_spectrum(
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for this visualization")
+    _ensure_matplotlib()
     
-    Lambda, U = complex.eigendecompositions[level]
-    Lambda = Lambda.cpu().numpy()
+    Lambda, U = _np_eig(complex, level)
     
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _subplots(fig, 1, (10, 4))
     
-    # Plot eigenvalues
-    colors = ['#e74c3c' if l < 1e-6 else '#3498db' for l in Lambda]
+    # Plot eigenvalues (row 0: harmonic, row 1: non-harmonic)
+    colors = _SPECTRUM_PALETTE[(Lambda >= 1e-6).astype(np.uint8)]
     bars = ax.bar(range(len(Lambda)), Lambda, color=colors, alpha=0.7)
     
     # Mark spectral gap
@@ -84,7 +164,7 @@ def plot_hodge_spectrum(
     ax.legend(handles=[harmonic_patch, nonharm_patch] + 
               ([ax.get_lines()[0]] if show_gap else []))
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -92,7 +172,8 @@ def plot_eigenvector(
     complex,
     level: int = 0,
     mode: int = 0,
-    title: str = None
+    title: str = None,
+    fig=None
 ):
     """
     Visualize a Hodge Laplacian eigenvector on the simplicial complex.
@@ -102,41 +183,42 @@ def plot_eigenvector(
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for this visualization")
+    _ensure_matplotlib()
     
-    Lambda, U = complex.eigendecompositions[level]
-    Lambda = Lambda.cpu().numpy()
-    U = U.cpu().numpy()
+    Lambda, U = _np_eig(complex, level)
     
     eigenvector = U[:, mode]
     eigenvalue = Lambda[mode]
     
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig, ax = _subplots(fig, 1, (8, 8))
     
     # Get vertex positions (layout)
     n_vertices = complex.n_simplices[0]
-    angles = np.linspace(0, 2*np.pi, n_vertices, endpoint=False)
-    pos = {i: (np.cos(a), np.sin(a)) for i, a in enumerate(angles)}
+    pos = _circle_layout(n_vertices)
+    
+    # Edge segments [E, 2, 2] for a single LineCollection
+    if len(complex.simplices) > 1:
+        segments = pos[complex.sorted_simplices[1]]
+    else:
+        segments = np.zeros((0, 2, 2))
     
     if level == 0:
         # Vertex coloring
         vmin, vmax = eigenvector.min(), eigenvector.max()
         norm = plt.Normalize(vmin=vmin, vmax=vmax)
-        colors = plt.cm.RdBu_r(norm(eigenvector))
         
-        for i, (x, y) in pos.items():
-            ax.scatter(x, y, c=[colors[i]], s=500, zorder=2)
-            ax.annotate(str(i), (x, y), ha='center', va='center', 
-                       fontsize=10, fontweight='bold')
+        ax.scatter(pos[:, 0], pos[:, 1], c=_RDBU(norm(eigenvector)),
+                   s=500, zorder=2)
+        for i, (x, y) in enumerate(pos):
+            ax.text(x, y, str(i), ha='center', va='center',
+                    fontsize=10, fontweight='bold')
         
         # Draw edges
-        if len(complex.simplices) > 1:
-            for edge in complex.simplices[1]:
-                e = tuple(sorted(edge))
-                x = [pos[e[0]][0], pos[e[1]][0]]
-                y = [pos[e[0]][1], pos[e[1]][1]]
-                ax.plot(x, y, 'k-', alpha=0.3, linewidth=1, zorder=1)
+        ax.add_collection(LineCollection(
+            segments, colors='k', alpha=0.3, linewidths=1, zorder=1
+        ))
         
-        sm = plt.cm.ScalarMappable(cmap='RdBu_r', norm=norm)
+        sm = plt.cm.ScalarMappable(cmap=_RDBU, norm=norm)
         plt.colorbar(sm, ax=ax, label='Eigenvector value')
         
     elif level == 1:
@@ -144,19 +226,18 @@ def plot_eigenvector(
         vmin, vmax = eigenvector.min(), eigenvector.max()
         norm = plt.Normalize(vmin=vmin, vmax=vmax)
         
-        for i, edge in enumerate(complex.simplices[1]):
-            e = tuple(sorted(edge))
-            x = [pos[e[0]][0], pos[e[1]][0]]
-            y = [pos[e[0]][1], pos[e[1]][1]]
-            color = plt.cm.RdBu_r(norm(eigenvector[i]))
-            ax.plot(x, y, c=color, linewidth=3, zorder=1)
+        edges = LineCollection(segments, cmap=_RDBU, norm=norm,
+                               linewidths=3, zorder=1)
+        edges.set_array(eigenvector)
+        ax.add_collection(edges)
         
         # Draw vertices
-        for i, (x, y) in pos.items():
-            ax.scatter(x, y, c='white', s=200, edgecolors='black', zorder=2)
-            ax.annotate(str(i), (x, y), ha='center', va='center', fontsize=8)
+        ax.scatter(pos[:, 0], pos[:, 1], c='white', s=200,
+                   edgecolors='black', zorder=2)
+        for i, (x, y) in enumerate(pos):
+            ax.text(x, y, str(i), ha='center', va='center', fontsize=8)
         
-        sm = plt.cm.ScalarMappable(cmap='RdBu_r', norm=norm)
+        sm = plt.cm.ScalarMappable(cmap=_RDBU, norm=norm)
         plt.colorbar(sm, ax=ax, label='Eigenvector value')
     
     ax.set_xlim(-1.5, 1.5)
@@ -167,7 +248,7 @@ def plot_eigenvector(
     mode_type = "Harmonic" if eigenvalue < 1e-6 else "Non-harmonic"
     ax.set_title(title or f'{mode_type} mode {mode} (λ = {eigenvalue:.4f})', fontsize=14)
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -177,7 +258,8 @@ def plot_eigenvector(
 
 def plot_spectral_bias_evolution(
     history: Dict[str, List],
-    title: str = "Spectral Bias During Training"
+    title: str = "Spectral Bias During Training",
+    fig=None
 ):
     """
     Visualize how harmonic vs non-harmonic components evolve during training.
@@ -186,16 +268,27 @@ def plot_spectral_bias_evolution(
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for this visualization")
+    _ensure_matplotlib()
+    
+    # Coerce each series to a contiguous float array once
+    series = {
+        key: np.ascontiguousarray(history[key], dtype=np.float64)
+        for key in ('harmonic_convergence', 'nonharmonic_convergence',
+                    'train_loss', 'val_loss')
+        if key in history
+    }
+    h = series.get('harmonic_convergence')
+    nh = series.get('nonharmonic_convergence')
     
-    fig, axes = plt.subplots(1, 3, figsize=(15, 4))
+    fig, axes = _subplots(fig, 3, (15, 4))
     
     # Plot 1: Energy evolution
     ax1 = axes[0]
-    if 'harmonic_convergence' in history:
-        ax1.plot(history['harmonic_convergence'], 'r-', linewidth=2, 
+    if h is not None:
+        ax1.plot(h, 'r-', linewidth=2, 
                 label='Harmonic energy', alpha=0.8)
-    if 'nonharmonic_convergence' in history:
-        ax1.plot(history['nonharmonic_convergence'], 'b-', linewidth=2,
+    if nh is not None:
+        ax1.plot(nh, 'b-', linewidth=2,
                 label='Non-harmonic energy', alpha=0.8)
     ax1.set_xlabel('Epoch')
     ax1.set_ylabel('Energy')
@@ -205,12 +298,12 @@ def plot_spectral_bias_evolution(
     
     # Plot 2: Loss curves
     ax2 = axes[1]
-    if 'train_loss' in history:
-        ax2.plot(history['train_loss'], 'b-', linewidth=2, label='Train loss')
-    if 'val_loss' in history:
+    if 'train_loss' in series:
+        ax2.plot(series['train_loss'], 'b-', linewidth=2, label='Train loss')
+    if 'val_loss' in series:
         # Interpolate val_loss to match train_loss length
-        val_epochs = np.linspace(0, len(history['train_loss'])-1, len(history['val_loss']))
-        ax2.plot(val_epochs, history['val_loss'], 'r--', linewidth=2, label='Val loss')
+        val_epochs = np.linspace(0, len(series['train_loss'])-1, len(series['val_loss']))
+        ax2.plot(val_epochs, series['val_loss'], 'r--', linewidth=2, label='Val loss')
     ax2.set_xlabel('Epoch')
     ax2.set_ylabel('Loss')
     ax2.set_title('Training Progress')
@@ -218,9 +311,7 @@ def plot_spectral_bias_evolution(
     
     # Plot 3: Convergence ratio
     ax3 = axes[2]
-    if 'harmonic_convergence' in history and 'nonharmonic_convergence' in history:
-        h = np.array(history['harmonic_convergence'])
-        nh = np.array(history['nonharmonic_convergence'])
+    if h is not None and nh is not None:
         ratio = nh / (h + 1e-10)
         ax3.plot(ratio, 'g-', linewidth=2)
         ax3.axhline(y=15, color='gray', linestyle='--', label='Predicted ratio (L=12)')
@@ -230,31 +321,36 @@ def plot_spectral_bias_evolution(
         ax3.legend()
     
     fig.suptitle(title, fontsize=14, y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
 def plot_fixed_point_analysis(
     spectral_radii: List[float],
     output_types: List[str],
-    title: str = "Fixed Point Classification"
+    title: str = "Fixed Point Classification",
+    fig=None,
+    seed: int = 0
 ):
     """
     Visualize the relationship between Jacobian spectral radius and output type.
     
     Validates Prediction 5: ρ < 1 → repetitive, ρ > 1 → hallucinating, ρ ≈ 1 → creative.
+    The vertical jitter is drawn from default_rng(seed), so plots are reproducible.
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for this visualization")
+    _ensure_matplotlib()
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _subplots(fig, 1, (10, 6))
     
     # Color by output type
     colors = {'repetitive': '#e74c3c', 'hallucinating': '#9b59b6', 'creative': '#2ecc71'}
     
-    for rho, out_type in zip(spectral_radii, output_types):
-        ax.scatter(rho, np.random.uniform(-0.5, 0.5), 
-                  c=colors.get(out_type, 'gray'), s=100, alpha=0.7)
+    rhos = np.asarray(spectral_radii, dtype=np.float64)
+    jitter = np.random.default_rng(seed).uniform(-0.5, 0.5, size=rhos.size)
+    point_colors = [colors.get(out_type, 'gray') for out_type in output_types]
+    ax.scatter(rhos, jitter, c=point_colors, s=100, alpha=0.7)
     
     # Add boundary lines
     ax.axvline(x=0.95, color='gray', linestyle='--', alpha=0.5)
@@ -274,7 +370,7 @@ def plot_fixed_point_analysis(
     ax.set_title(title, fontsize=14)
     ax.set_yticks([])
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -285,7 +381,8 @@ def plot_fixed_point_analysis(
 def plot_tropical_degeneration(
     attention_matrix: torch.Tensor,
     temperatures: List[float] = [1.0, 0.5, 0.1, 0.01],
-    title: str = "Tropical Degeneration of Attention"
+    title: str = "Tropical Degeneration of Attention",
+    fig=None
 ):
     """
     Visualize how attention patterns change as temperature → 0 (tropical limit).
@@ -294,38 +391,45 @@ def plot_tropical_degeneration(
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for this visualization")
+    _ensure_matplotlib()
     
     A = attention_matrix.cpu().numpy()
     n = A.shape[0]
     
-    fig, axes = plt.subplots(1, len(temperatures), figsize=(4*len(temperatures), 4))
+    # Temperature-scaled softmax for all temperatures at once: [T, n, n]
+    temps = np.asarray(temperatures, dtype=A.dtype)[:, None, None]
+    A_softmax = softmax(A[None] / temps, axis=-1)
+    
+    # Softmax weights already lie in [0, 1], so colormap every panel at once
+    # into uint8 RGBA and let imshow skip its per-panel normalize + lookup
+    rgba = _BLUES(A_softmax, bytes=True)
+    
+    fig, axes = _subplots(fig, len(temperatures), (4*len(temperatures), 4))
     
     for i, temp in enumerate(temperatures):
         ax = axes[i] if len(temperatures) > 1 else axes
         
-        # Apply temperature scaling
-        A_scaled = A / temp
-        A_softmax = np.exp(A_scaled) / np.exp(A_scaled).sum(axis=-1, keepdims=True)
-        
-        im = ax.imshow(A_softmax, cmap='Blues', vmin=0, vmax=1)
+        ax.imshow(rgba[i], interpolation='nearest')
         ax.set_title(f'T = {temp}', fontsize=12)
         ax.set_xlabel('Key')
         ax.set_ylabel('Query')
         
         if i == len(temperatures) - 1:
-            plt.colorbar(im, ax=ax, label='Attention weight')
+            sm = plt.cm.ScalarMappable(cmap=_BLUES, norm=plt.Normalize(vmin=0, vmax=1))
+            plt.colorbar(sm, ax=ax, label='Attention weight')
     
     # Mark the tropical limit
     axes[-1].set_title(f'T = {temperatures[-1]} (→ argmax)', fontsize=12)
     
     fig.suptitle(title, fontsize=14, y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
 def plot_quantization_comparison(
     results: Dict[str, Dict[int, float]],
-    title: str = "Quantization Comparison"
+    title: str = "Quantization Comparison",
+    fig=None
 ):
     """
     Compare linear vs log quantization accuracy across bit widths.
@@ -334,8 +438,9 @@ def plot_quantization_comparison(
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for this visualization")
+    _ensure_matplotlib()
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _subplots(fig, 1, (10, 6))
     
     bits = sorted(results['linear'].keys())
     linear_acc = [results['linear'][b] for b in bits]
@@ -367,7 +472,7 @@ def plot_quantization_comparison(
             ax.annotate(f'+{(lg-l)*100:.1f}%', (x[i] + width/2, lg + 0.01),
                        ha='center', fontsize=9, color='#e74c3c')
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -381,6 +486,7 @@ def create_interactive_spectrum(complex, max_level: int = 2):
     """
     if not HAS_PLOTLY:
         raise ImportError("plotly required for this visualization")
+    _ensure_plotly()
     
     fig = make_subplots(
         rows=1, cols=min(max_level + 1, len(complex.eigendecompositions)),
@@ -389,10 +495,9 @@ def create_interactive_spectrum(complex, max_level: int = 2):
     )
     
     for k in range(min(max_level + 1, len(complex.eigendecompositions))):
-        Lambda, _ = complex.eigendecompositions[k]
-        Lambda = Lambda.cpu().numpy()
+        Lambda, _ = _np_eig(complex, k)
         
-        colors = ['red' if l < 1e-6 else 'blue' for l in Lambda]
+        colors = np.where(Lambda < 1e-6, 'red', 'blue')
         
         fig.add_trace(
             go.Bar(
@@ -424,34 +529,38 @@ def create_interactive_complex(
     """
     if not HAS_PLOTLY:
         raise ImportError("plotly required for this visualization")
+    _ensure_plotly()
     
     n_vertices = complex.n_simplices[0]
     
     # Layout vertices in 3D (spectral layout using first 3 eigenvectors)
     if complex.n_simplices[0] > 3:
-        Lambda, U = complex.eigendecompositions[0]
+        Lambda, U = _np_eig(complex, 0)
         # Use non-trivial eigenvectors for layout
         start_idx = complex.betti_numbers[0]  # Skip harmonic modes
         if U.shape[1] >= start_idx + 3:
-            pos = U[:, start_idx:start_idx+3].cpu().numpy()
+            pos = U[:, start_idx:start_idx+3]
         else:
             # Fall back to circular layout
-            angles = np.linspace(0, 2*np.pi, n_vertices, endpoint=False)
-            pos = np.column_stack([np.cos(angles), np.sin(angles), np.zeros(n_vertices)])
+            pos = np.column_stack([_circle_layout(n_vertices), np.zeros(n_vertices)])
     else:
-        angles = np.linspace(0, 2*np.pi, n_vertices, endpoint=False)
-        pos = np.column_stack([np.cos(angles), np.sin(angles), np.zeros(n_vertices)])
+        pos = np.column_stack([_circle_layout(n_vertices), np.zeros(n_vertices)])
+    
+    # One contiguous float32 [N, 3] block so edge gathers below are a single copy
+    pos = np.ascontiguousarray(pos, dtype=np.float32)
     
     fig = go.Figure()
     
     # Add edges
     if len(complex.simplices) > 1:
-        edge_x, edge_y, edge_z = [], [], []
-        for edge in complex.simplices[1]:
-            e = tuple(sorted(edge))
-            edge_x.extend([pos[e[0], 0], pos[e[1], 0], None])
-            edge_y.extend([pos[e[0], 1], pos[e[1], 1], None])
-            edge_z.extend([pos[e[0], 2], pos[e[1], 2], None])
+        edges = complex.sorted_simplices[1]
+        P = pos[edges]  # [E, 2, 3]
+        
+        # (source, target, NaN) per edge; NaN breaks the Plotly line
+        edge_x, edge_y, edge_z = np.full((3, 3 * len(edges)), np.nan, dtype=np.float32)
+        for d, coord in enumerate((edge_x, edge_y, edge_z)):
+            coord[0::3] = P[:, 0, d]
+            coord[1::3] = P[:, 1, d]
         
         fig.add_trace(go.Scatter3d(
             x=edge_x, y=edge_y, z=edge_z,
@@ -463,12 +572,8 @@ def create_interactive_complex(
     
     # Add triangles (as mesh)
     if len(complex.simplices) > 2 and len(complex.simplices[2]) > 0:
-        i_list, j_list, k_list = [], [], []
-        for tri in complex.simplices[2]:
-            t = tuple(sorted(tri))
-            i_list.append(t[0])
-            j_list.append(t[1])
-            k_list.append(t[2])
+        tris = complex.sorted_simplices[2]
+        i_list, j_list, k_list = tris.T
         
         fig.add_trace(go.Mesh3d(
             x=pos[:, 0], y=pos[:, 1], z=pos[:, 2],
@@ -513,39 +618,108 @@ def create_interactive_complex(
 # PART V: Export Functions
 # =============================================================================
 
+def _json_default(obj):
+    """Serialize numpy values the JSON encoder does not handle natively."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_array(arr: np.ndarray) -> Dict:
+    """
+    Pack an array as a base64 float32 buffer.
+    
+    Web consumers decode with new Float32Array(bytes.buffer) and reshape
+    using 'shape' (row-major, little-endian).
+    """
+    arr = np.ascontiguousarray(arr, dtype='<f4')
+    return {
+        'dtype': 'float32',
+        'shape': list(arr.shape),
+        'data_b64': base64.b64encode(arr.tobytes()).decode('ascii')
+    }
+
+
+def _dump_json(obj, compact: bool) -> bytes:
+    """Encode one JSON value (orjson when installed, else stdlib json)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    layout = {'separators': (',', ':')} if compact else {'indent': 2}
+    return json.dumps(obj, default=_json_default, **layout).encode('utf-8')
+
+
 def export_visualization_data(
     complex,
     history: Optional[Dict] = None,
-    output_path: str = 'visualization_data.json'
+    output_path: str = 'visualization_data.json',
+    compact: bool = True
 ):
     """
     Export visualization data to JSON for use in web-based visualizations.
+    
+    Spectra are packed as base64 float32 buffers (see _encode_array) rather
+    than nested lists. The document is streamed section by section, and the
+    spectra level by level, through a 1 MiB buffer. Levels are read from
+    complex.eigendecompositions directly rather than through _np_eig, so the
+    export keeps only one host eigenvector matrix alive at a time (copies the
+    plots already cached are untouched). Output is compact unless
+    compact=False asks for indentation (applied within each section).
+    
+    Returns the exported metadata (everything except the spectra).
     """
     data = {
         'simplices': {
-            f'level_{k}': [list(s) for s in complex.simplices[k]]
-            for k in range(len(complex.simplices))
+            f'level_{k}': simplex_arr.tolist()
+            for k, simplex_arr in enumerate(complex.sorted_simplices)
         },
         'betti_numbers': complex.betti_numbers,
-        'spectra': {
-            f'level_{k}': {
-                'eigenvalues': complex.eigendecompositions[k][0].cpu().tolist(),
-                'eigenvectors': complex.eigendecompositions[k][1].cpu().tolist()
-            }
-            for k in range(len(complex.eigendecompositions))
-        }
     }
     
     if history is not None:
-        data['training_history'] = {
-            k: [float(v) if isinstance(v, (int, float, np.floating)) else v 
-                for v in vals]
-            for k, vals in history.items()
-            if isinstance(vals, list)
-        }
-    
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+        data['training_history'] = {}
+        for k, vals in history.items():
+            if not isinstance(vals, list):
+                continue
+            if None in vals:
+                # The float cast would turn None into NaN, which is not JSON
+                data['training_history'][k] = list(vals)
+                continue
+            try:
+                # One C-level cast for numeric series
+                data['training_history'][k] = np.asarray(vals, dtype=np.float64).tolist()
+            except (TypeError, ValueError):
+                data['training_history'][k] = list(vals)
+    
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        f.write(b'{"simplices":')
+        f.write(_dump_json(data['simplices'], compact))
+        f.write(b',"betti_numbers":')
+        f.write(_dump_json(data['betti_numbers'], compact))
+        
+        f.write(b',"spectra":{')
+        for k in range(len(complex.eigendecompositions)):
+            # Read around _np_eig so host copies are dropped after encoding
+            Lambda, U = complex.eigendecompositions[k]
+            Lambda, U = Lambda.cpu().float().numpy(), U.cpu().float().numpy()
+            if k > 0:
+                f.write(b',')
+            f.write(f'"level_{k}":'.encode('ascii'))
+            f.write(_dump_json({
+                'eigenvalues': _encode_array(Lambda),
+                'eigenvectors': _encode_array(U)
+            }, compact))
+            del Lambda, U
+        f.write(b'}')
+        
+        if 'training_history' in data:
+            f.write(b',"training_history":')
+            f.write(_dump_json(data['training_history'], compact))
+        f.write(b'}')
     
     print(f"Visualization data exported to {output_path}")
     return data
@@ -555,6 +729,13 @@ def export_visualization_data(
 # PART VI: Demo
 # =============================================================================
 
+def _save_png(fig, path: str, dpi: int = 150):
+    """Save a figure as PNG through one large buffer with fast zlib level 1."""
+    with open(path, 'wb', buffering=1 << 20) as fh:
+        fig.savefig(fh, format='png', dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
+
+
 def demo_visualizations():
     """Run a demo of all visualizations."""
     print("=" * 60)
@@ -578,28 +759,33 @@ def demo_visualizations():
     print(f"Betti numbers: {complex.betti_numbers}")
     
     if HAS_MATPLOTLIB:
+        _ensure_matplotlib()
+        
+        # One figure, cleared and resized by each plot
+        fig = plt.figure(figsize=(10, 4))
+        
         print("\n1. Plotting Hodge spectrum...")
-        fig1 = plot_hodge_spectrum(complex, level=0)
-        plt.savefig('hodge_spectrum.png', dpi=150, bbox_inches='tight')
+        plot_hodge_spectrum(complex, level=0, fig=fig)
+        _save_png(fig, 'hodge_spectrum.png')
         print("   Saved: hodge_spectrum.png")
         
         print("\n2. Plotting harmonic eigenvector...")
-        fig2 = plot_eigenvector(complex, level=0, mode=0)
-        plt.savefig('harmonic_mode.png', dpi=150, bbox_inches='tight')
+        plot_eigenvector(complex, level=0, mode=0, fig=fig)
+        _save_png(fig, 'harmonic_mode.png')
         print("   Saved: harmonic_mode.png")
         
         print("\n3. Plotting non-harmonic eigenvector...")
-        fig3 = plot_eigenvector(complex, level=0, mode=1)
-        plt.savefig('nonharmonic_mode.png', dpi=150, bbox_inches='tight')
+        plot_eigenvector(complex, level=0, mode=1, fig=fig)
+        _save_png(fig, 'nonharmonic_mode.png')
         print("   Saved: nonharmonic_mode.png")
         
         print("\n4. Plotting tropical degeneration...")
         A = torch.randn(n, n)
-        fig4 = plot_tropical_degeneration(A)
-        plt.savefig('tropical_degeneration.png', dpi=150, bbox_inches='tight')
+        plot_tropical_degeneration(A, fig=fig)
+        _save_png(fig, 'tropical_degeneration.png')
         print("   Saved: tropical_degeneration.png")
         
-        plt.close('all')
+        plt.close(fig)
     else:
         print("\nMatplotlib not available. Skipping static visualizations.")
     
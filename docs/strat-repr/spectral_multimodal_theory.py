@@ -26,15 +26,31 @@ Date: 2025
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Callable, ClassVar
+from dataclasses import dataclass, field, InitVar
+from functools import cached_property
 from scipy import sparse
 from scipy.sparse.linalg import eigsh
+from scipy.spatial import cKDTree
+from scipy.fft import dct, dctn
 from scipy.special import gamma as gamma_func
 from scipy.integrate import quad
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
+import importlib.util
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+
+try:
+    import numba
+    from numba.extending import is_jitted
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# pynndescent is heavy to import; only probe for it here
+HAS_PYNNDESCENT = importlib.util.find_spec('pynndescent') is not None
 
 
 # ==============================================================================
@@ -47,25 +63,119 @@ class SpectralData:
     eigenvalues: np.ndarray      # λ_0 ≤ λ_1 ≤ ... ≤ λ_{n-1}
     eigenvectors: np.ndarray     # Column i is eigenvector for λ_i
     spectral_dimension: float    # Estimated d_s from Weyl's law
-    laplacian: np.ndarray        # The original Laplacian matrix
+    laplacian: np.ndarray        # The original Laplacian (dense or scipy sparse)
+    # Fast Z ↦ Z @ eigenvectors (e.g. a DCT) when the basis is known in closed form
+    to_eigenbasis: Optional[Callable[[np.ndarray], np.ndarray]] = field(
+        default=None, repr=False, compare=False)
+    
+    # Cutoff for the cached scratch below (zeta / heat-kernel default)
+    MIN_EIGENVALUE: ClassVar[float] = 1e-8
+    
+    @cached_property
+    def valid_mask(self) -> np.ndarray:
+        """Mask of eigenvalues above MIN_EIGENVALUE."""
+        return self.eigenvalues > self.MIN_EIGENVALUE
+    
+    @cached_property
+    def valid_eigenvalues(self) -> np.ndarray:
+        return self.eigenvalues[self.valid_mask]
+    
+    @cached_property
+    def log_eigenvalues(self) -> np.ndarray:
+        """log λ over the valid eigenvalues, shared by every zeta evaluation."""
+        return np.log(self.valid_eigenvalues)
+
+
+def _valid_spectrum(eigenvalues, min_eigenvalue: float = 1e-8,
+                    log: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (valid mask, λ or log λ over the valid eigenvalues).
+    
+    Accepts a raw eigenvalue array or a SpectralData; the latter reuses its
+    cached scratch when the cutoff matches.
+    """
+    if isinstance(eigenvalues, SpectralData):
+        if min_eigenvalue == SpectralData.MIN_EIGENVALUE:
+            values = eigenvalues.log_eigenvalues if log else eigenvalues.valid_eigenvalues
+            return eigenvalues.valid_mask, values
+        eigenvalues = eigenvalues.eigenvalues
+    valid = eigenvalues > min_eigenvalue
+    values = eigenvalues[valid]
+    return valid, (np.log(values) if log else values)
 
 
 @dataclass
 class ConceptSubspace:
-    """A concept represented as a subspace of the representation."""
+    """
+    A concept represented as a subspace of the representation.
+    
+    projection may be omitted (None); it is then built from the basis as
+    P_V = U U^T on first access.
+    """
     name: str
-    projection: np.ndarray       # Projection matrix P_V onto subspace
-    dimension: int               # dim(V)
-    basis: np.ndarray           # Orthonormal basis vectors
+    projection: InitVar[Optional[np.ndarray]] = None  # Projection matrix P_V onto subspace
+    dimension: Optional[int] = None  # dim(V); defaults to basis.shape[1]
+    basis: Optional[np.ndarray] = None  # Orthonormal basis vectors, (n, dim(V))
+    _projection: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, projection: Optional[np.ndarray]):
+        if self.basis is None:
+            raise ValueError(f"ConceptSubspace {self.name!r} needs a basis")
+        if self.dimension is None:
+            self.dimension = self.basis.shape[1]
+        self._projection = projection
+    
+    def apply(self, v: np.ndarray) -> np.ndarray:
+        """P_V v = U (U^T v), without forming the (n, n) projection."""
+        return self.basis @ (self.basis.T @ v)
+
+
+def _concept_projection(self: ConceptSubspace) -> np.ndarray:
+    """Dense projection matrix P_V = U U^T, built only on request."""
+    if self._projection is None:
+        self._projection = self.basis @ self.basis.T
+    return self._projection
+
+
+# Installed after @dataclass so the init field keeps its None default
+ConceptSubspace.projection = property(_concept_projection)
 
 
 @dataclass
 class CrossModalData:
-    """Data for analyzing cross-modal relationships."""
-    intertwiner: np.ndarray              # Optimal T: V_1 → V_2
+    """
+    Data for analyzing cross-modal relationships.
+    
+    Pass a precomputed intertwiner, or the eigenbases to have it built as
+    T = V2 M V1^T on first access.
+    """
     spectral_correspondence: np.ndarray  # M[i,j] = coupling in eigenbasis
     intertwining_error: float            # ||TL_1 - L_2T||_F^2
     eigenvalue_matching: List[Tuple]     # [(λ_1^i, λ_2^j, weight), ...]
+    eigenbases: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        default=None, repr=False)        # (V1, V2), for reconstructing T
+    intertwiner: InitVar[Optional[np.ndarray]] = None  # Optimal T: V_1 → V_2
+    _intertwiner: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, intertwiner: Optional[np.ndarray]):
+        self._intertwiner = intertwiner
+
+
+def _cross_modal_intertwiner(self: CrossModalData) -> np.ndarray:
+    """Optimal T: V_1 → V_2 in original coordinates, T = V2 M V1^T (built on first access)."""
+    if self._intertwiner is None:
+        if self.eigenbases is None:
+            raise ValueError(
+                "CrossModalData has neither an intertwiner nor eigenbases to build it from")
+        V1, V2 = self.eigenbases
+        self._intertwiner = V2 @ self.spectral_correspondence @ V1.T
+    return self._intertwiner
+
+
+# Installed after @dataclass so the init field keeps its None default
+CrossModalData.intertwiner = property(_cross_modal_intertwiner)
 
 
 # ==============================================================================
@@ -85,33 +195,130 @@ class RepresentationMorphism:
         """
         Args:
             name: Human-readable name (e.g., "1D_text", "2D_image")
-            adjacency_fn: Function (i, j, params) → bool indicating if i,j are neighbors
+            adjacency_fn: Function (i, j, params) → bool indicating if i,j are neighbors.
+                May carry an ``edges(n, **params)`` attribute returning the
+                symmetric edge list as int32 (rows, cols) arrays (all
+                built-in predicates do), or, for user predicates, a
+                ``vectorized(n, **params)`` attribute returning the full (n, n)
+                boolean matrix; either is used instead of the pair loop.
+                A numba-jitted predicate (called without params) is scanned
+                in compiled code. A ``stencil(n, **params)`` attribute, if
+                present, builds the Laplacian directly.
         """
         self.name = name
         self.adjacency_fn = adjacency_fn
     
-    def build_adjacency(self, n: int, **params) -> np.ndarray:
-        """Build adjacency matrix for n elements."""
-        A = np.zeros((n, n))
-        for i in range(n):
-            for j in range(i+1, n):
-                if self.adjacency_fn(i, j, n, **params):
-                    A[i, j] = 1
-                    A[j, i] = 1
-        return A
-    
-    def build_laplacian(self, n: int, normalized: bool = True, **params) -> np.ndarray:
-        """Build graph Laplacian L = D - A (optionally normalized)."""
-        A = self.build_adjacency(n, **params)
-        D = np.diag(A.sum(axis=1))
-        L = D - A
+    def build_adjacency(self, n: int, **params) -> sparse.csr_matrix:
+        """Build sparse (CSR) adjacency matrix for n elements."""
+        edges = getattr(self.adjacency_fn, 'edges', None)
+        vectorized = getattr(self.adjacency_fn, 'vectorized', None)
+        if edges is not None:
+            rows, cols = edges(n, **params)
+        elif vectorized is not None:
+            mask = vectorized(n, **params)
+            np.fill_diagonal(mask, False)
+            rows, cols = np.nonzero(mask)
+        else:
+            if HAS_NUMBA and not params and is_jitted(self.adjacency_fn):
+                upper_r, upper_c = _pair_scan_numba(n, self.adjacency_fn)
+            else:
+                pairs = [(i, j) for i in range(n) for j in range(i+1, n)
+                         if self.adjacency_fn(i, j, n, **params)]
+                upper = np.array(pairs, dtype=np.int32).reshape(-1, 2)
+                upper_r, upper_c = upper[:, 0], upper[:, 1]
+            rows = np.concatenate([upper_r, upper_c])
+            cols = np.concatenate([upper_c, upper_r])
+        
+        data = np.ones(len(rows))
+        return sparse.coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+    
+    def build_laplacian(self, n: int, normalized: bool = True,
+                        **params) -> sparse.csr_matrix:
+        """Build sparse graph Laplacian L = D - A (optionally normalized)."""
+        stencil = getattr(self.adjacency_fn, 'stencil', None)
+        L = stencil(n, **params) if stencil is not None else None
+        if L is not None:
+            degrees = L.diagonal()
+        else:
+            A = self.build_adjacency(n, **params)
+            degrees = np.asarray(A.sum(axis=1)).ravel()
+            L = sparse.csr_matrix(sparse.diags(degrees) - A)
         
         if normalized:
-            # L_norm = D^{-1/2} L D^{-1/2} = I - D^{-1/2} A D^{-1/2}
-            d_inv_sqrt = np.diag(1.0 / np.sqrt(A.sum(axis=1) + 1e-10))
-            L = d_inv_sqrt @ L @ d_inv_sqrt
+            # L_norm = D^{-1/2} L D^{-1/2} = I - D^{-1/2} A D^{-1/2},
+            # applied as an O(nnz) scaling of the stored entries
+            d_inv_sqrt = 1.0 / np.sqrt(degrees + 1e-10)
+            row_idx = np.repeat(np.arange(n), np.diff(L.indptr))
+            L.data *= d_inv_sqrt[row_idx] * d_inv_sqrt[L.indices]
         
         return L
+    
+    def analytic_spectrum(self, n: int, normalized: bool = True,
+                          num_eigenvectors: int = None,
+                          **params) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Closed-form (eigenvalues, eigenvectors) of the Laplacian, if known.
+        
+        Returns None when the adjacency rule has no registered ``spectrum``
+        form or the requested variant has no closed form (e.g. normalized).
+        """
+        spectrum = getattr(self.adjacency_fn, 'spectrum', None)
+        if spectrum is None or normalized:
+            return None
+        if num_eigenvectors is None:
+            num_eigenvectors = n
+        return spectrum(n, min(num_eigenvectors, n), **params)
+    
+    def compute_spectral_data(self, n: int, num_eigenvectors: int = None,
+                              normalized: bool = True, eigenvector_dtype: np.dtype = np.float64,
+                              **params) -> 'SpectralData':
+        """Spectral decomposition of this morphism's Laplacian, analytic when possible."""
+        L = self.build_laplacian(n, normalized=normalized, **params)
+        pairs = self.analytic_spectrum(n, normalized=normalized,
+                                       num_eigenvectors=num_eigenvectors, **params)
+        if pairs is None:
+            return compute_spectral_data(L, num_eigenvectors, eigenvector_dtype=eigenvector_dtype)
+        
+        eigenvalues, eigenvectors = pairs
+        transform = getattr(self.adjacency_fn, 'eigenbasis_transform', None)
+        return SpectralData(
+            eigenvalues=eigenvalues.astype(np.float64),
+            eigenvectors=eigenvectors.astype(eigenvector_dtype),
+            spectral_dimension=estimate_spectral_dimension(eigenvalues),
+            laplacian=L,
+            to_eigenbasis=(transform(n, len(eigenvalues), **params)
+                           if transform is not None else None)
+        )
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True)
+    def _pair_scan_numba(n, predicate):
+        """Upper-triangle (i < j) pairs accepted by a jitted predicate, as int32."""
+        counts = np.zeros(n, dtype=np.int64)
+        for i in numba.prange(n):
+            c = 0
+            for j in range(i + 1, n):
+                if predicate(i, j, n):
+                    c += 1
+            counts[i] = c
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        rows = np.empty(offsets[n], dtype=np.int32)
+        cols = np.empty(offsets[n], dtype=np.int32)
+        for i in numba.prange(n):
+            p = offsets[i]
+            for j in range(i + 1, n):
+                if predicate(i, j, n):
+                    rows[p] = i
+                    cols[p] = j
+                    p += 1
+        return rows, cols
+
+
+def _to_dense(L) -> np.ndarray:
+    """Dense view of a Laplacian that may be stored as a scipy sparse matrix."""
+    return L.toarray() if sparse.issparse(L) else np.asarray(L)
 
 
 # Standard morphisms for common modalities
@@ -152,6 +359,163 @@ def audio_1d_with_harmonics(i: int, j: int, n: int, num_harmonics: int = 3,
     return diff == 1 or (diff > 1 and diff <= num_harmonics and (i % diff == 0 or j % diff == 0))
 
 
+# Edge lists: generated directly per neighbor offset, O(|E|) instead of O(n²)
+
+def _offset_edges(n: int, offset: int,
+                  keep: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric int32 edges (i, i+offset) for the sources selected by keep."""
+    src = np.arange(max(n - offset, 0), dtype=np.int32)
+    if keep is not None:
+        src = src[keep[:len(src)]]
+    dst = src + np.int32(offset)
+    return np.concatenate([src, dst]), np.concatenate([dst, src])
+
+def _concat_edges(*edge_lists) -> Tuple[np.ndarray, np.ndarray]:
+    return (np.concatenate([r for r, _ in edge_lists]),
+            np.concatenate([c for _, c in edge_lists]))
+
+def _text_1d_edges(n: int, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    return _offset_edges(n, 1)
+
+def _image_2d_edges(n: int, width: int = None,
+                    **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    if width is None:
+        width = int(np.sqrt(n))
+    idx = np.arange(n, dtype=np.int32)
+    return _concat_edges(_offset_edges(n, 1, idx % width != width - 1),
+                         _offset_edges(n, width))
+
+def _video_3d_edges(n: int, width: int = None, height: int = None,
+                    **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    if width is None:
+        width = int(np.cbrt(n))
+    if height is None:
+        height = width
+    idx = np.arange(n, dtype=np.int32)
+    return _concat_edges(
+        _offset_edges(n, 1, idx % width != width - 1),
+        _offset_edges(n, width, (idx % (width * height)) // width != height - 1),
+        _offset_edges(n, width * height))
+
+def _audio_1d_edges(n: int, num_harmonics: int = 3,
+                    **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    # For diff d > 1, (i + d) % d == i % d, so the rule reduces to d | i
+    idx = np.arange(n, dtype=np.int32)
+    return _concat_edges(_offset_edges(n, 1),
+                         *(_offset_edges(n, d, idx % d == 0)
+                           for d in range(2, num_harmonics + 1)))
+
+# Stencil Laplacians: banded construction straight from sparse.diags
+
+def grid2d_laplacian(width: int, height: int) -> sparse.csr_matrix:
+    """
+    Combinatorial Laplacian of a height x width grid as a 5-point stencil.
+    
+    Offsets ±1 (masked at row ends) and ±width; the diagonal is the
+    true degree, so boundary nodes get 2 or 3 rather than 4.
+    """
+    n = width * height
+    right = np.ones(max(n - 1, 0))
+    right[width - 1::width] = 0
+    down = np.ones(max(n - width, 0))
+    
+    degree = np.zeros(n)
+    degree[:-1] += right
+    degree[1:] += right
+    degree[:n - width] += down
+    degree[width:] += down
+    
+    L = sparse.diags(degree, format='csr')
+    for band, offset in ((right, 1), (down, width)):
+        if len(band) and offset < n:
+            L = L - sparse.diags([band, band], [offset, -offset], shape=(n, n))
+    L = sparse.csr_matrix(L)
+    L.eliminate_zeros()
+    return L
+
+def _image_2d_stencil(n: int, width: int = None,
+                      **kwargs) -> Optional[sparse.csr_matrix]:
+    if width is None:
+        width = int(np.sqrt(n))
+    if n % width:
+        return None  # ragged last row: use the edge list
+    return grid2d_laplacian(width, n // width)
+
+image_2d_adjacency.stencil = _image_2d_stencil
+
+
+# Closed-form spectra of the combinatorial Laplacian L = D - A.
+# Path graph P_n: λ_k = 2 - 2cos(πk/n) with the orthonormal DCT-II basis;
+# grid P_h □ P_w: λ = λ_a + λ_b with Kronecker-product eigenvectors.
+
+def _path_eigenvalues(n: int) -> np.ndarray:
+    return 2.0 - 2.0 * np.cos(np.pi * np.arange(n) / n)
+
+def _path_eigenvectors(n: int, k: np.ndarray) -> np.ndarray:
+    """Columns are the DCT-II basis vectors for frequencies k."""
+    j = np.arange(n) + 0.5
+    V = np.sqrt(2.0 / n) * np.cos(np.pi * np.outer(j, k) / n)
+    V[:, np.asarray(k) == 0] = 1.0 / np.sqrt(n)
+    return V
+
+def _text_1d_spectrum(n: int, num: int,
+                      **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    k = np.arange(num)
+    return _path_eigenvalues(n)[:num], _path_eigenvectors(n, k)
+
+def _image_2d_spectrum(n: int, num: int, width: int = None,
+                       **kwargs) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    if width is None:
+        width = int(np.sqrt(n))
+    if n % width:
+        return None  # ragged last row: not a Cartesian product
+    height = n // width
+    
+    lam, order = _grid_spectrum_order(height, width, num)
+    a, b = np.divmod(order, width)
+    # v[r*width + c] = u_a[r] * u_b[c]
+    V = (_path_eigenvectors(height, a)[:, None, :] *
+         _path_eigenvectors(width, b)[None, :, :]).reshape(n, num)
+    return lam[order], V
+
+def _grid_spectrum_order(height: int, width: int,
+                         num: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Flat (a*width + b) eigenvalues and the indices of the num smallest."""
+    lam = np.add.outer(_path_eigenvalues(height), _path_eigenvalues(width)).ravel()
+    return lam, np.argsort(lam, kind='stable')[:num]
+
+# Eigenbasis transforms: Z @ V as an orthonormal DCT-II, O(N·n log n)
+# instead of the O(N·n·k) matmul, matching the bases above column for column
+
+def _text_1d_transform(n: int, num: int, **kwargs) -> Callable:
+    return lambda Z: dct(Z, type=2, norm='ortho', axis=-1)[..., :num]
+
+def _image_2d_transform(n: int, num: int, width: int = None,
+                        **kwargs) -> Optional[Callable]:
+    if width is None:
+        width = int(np.sqrt(n))
+    if n % width:
+        return None
+    height = n // width
+    _, order = _grid_spectrum_order(height, width, num)
+    
+    def transform(Z):
+        grid = np.reshape(Z, Z.shape[:-1] + (height, width))
+        coeffs = dctn(grid, type=2, norm='ortho', axes=(-2, -1))
+        return coeffs.reshape(Z.shape[:-1] + (n,))[..., order]
+    return transform
+
+text_1d_adjacency.spectrum = _text_1d_spectrum
+image_2d_adjacency.spectrum = _image_2d_spectrum
+text_1d_adjacency.eigenbasis_transform = _text_1d_transform
+image_2d_adjacency.eigenbasis_transform = _image_2d_transform
+
+text_1d_adjacency.edges = _text_1d_edges
+image_2d_adjacency.edges = _image_2d_edges
+video_3d_adjacency.edges = _video_3d_edges
+audio_1d_with_harmonics.edges = _audio_1d_edges
+
+
 # Pre-built morphism objects
 MORPHISM_TEXT = RepresentationMorphism("text_1d", text_1d_adjacency)
 MORPHISM_IMAGE = RepresentationMorphism("image_2d", image_2d_adjacency)
@@ -163,13 +527,17 @@ MORPHISM_AUDIO = RepresentationMorphism("audio_harmonic", audio_1d_with_harmonic
 # PART 3: SPECTRAL ANALYSIS
 # ==============================================================================
 
-def compute_spectral_data(L: np.ndarray, num_eigenvectors: int = None) -> SpectralData:
+def compute_spectral_data(L: np.ndarray, num_eigenvectors: int = None,
+                          eigenvector_dtype: np.dtype = np.float64) -> SpectralData:
     """
     Compute full spectral decomposition of Laplacian.
     
     Args:
         L: Laplacian matrix (n x n)
         num_eigenvectors: Number of eigenvectors to compute (default: all)
+        eigenvector_dtype: Storage dtype of the returned eigenvectors, e.g.
+               np.float32 to halve their memory. The eigensolve and the
+               eigenvalues (used in zeta/heat-kernel sums) stay float64.
     
     Returns:
         SpectralData with eigenvalues, eigenvectors, and spectral dimension
@@ -177,20 +545,23 @@ def compute_spectral_data(L: np.ndarray, num_eigenvectors: int = None) -> Spectr
     n = L.shape[0]
     if num_eigenvectors is None:
         num_eigenvectors = n
+    L_work = L.astype(np.float64, copy=False) if sparse.issparse(L) else np.asarray(L, dtype=np.float64)
     
-    # Use sparse solver for large matrices
-    if n > 500:
-        L_sparse = sparse.csr_matrix(L)
-        eigenvalues, eigenvectors = eigsh(L_sparse, k=min(num_eigenvectors, n-1), 
+    # Partial spectrum: ARPACK on the CSR Laplacian (matvec-only). The full
+    # spectrum stays dense since ARPACK cannot return all n pairs.
+    if num_eigenvectors < n - 1:
+        L_sparse = sparse.csr_matrix(L_work)
+        eigenvalues, eigenvectors = eigsh(L_sparse, k=num_eigenvectors, 
                                           which='SM', return_eigenvectors=True)
         # Sort by eigenvalue
         idx = np.argsort(eigenvalues)
         eigenvalues = eigenvalues[idx]
         eigenvectors = eigenvectors[:, idx]
     else:
-        eigenvalues, eigenvectors = np.linalg.eigh(L)
+        eigenvalues, eigenvectors = np.linalg.eigh(_to_dense(L_work))
         eigenvalues = eigenvalues[:num_eigenvectors]
         eigenvectors = eigenvectors[:, :num_eigenvectors]
+    eigenvectors = eigenvectors.astype(eigenvector_dtype, copy=False)
     
     # Estimate spectral dimension from Weyl's law
     # N(λ) ~ λ^{d_s/2} => log(k) ~ (d_s/2) * log(λ_k)
@@ -204,6 +575,16 @@ def compute_spectral_data(L: np.ndarray, num_eigenvectors: int = None) -> Spectr
     )
 
 
+def _fit_line(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """Least-squares (slope, intercept) of y ~ x in closed form."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    xm, ym = x.mean(), y.mean()
+    dx = x - xm
+    slope = np.dot(dx, y - ym) / (np.dot(dx, dx) + 1e-20)
+    return slope, ym - slope * xm
+
+
 def estimate_spectral_dimension(eigenvalues: np.ndarray, 
                                  min_eigenvalue: float = 1e-6) -> float:
     """
@@ -230,15 +611,8 @@ def estimate_spectral_dimension(eigenvalues: np.ndarray,
     mid_start = len(log_k) // 10
     mid_end = 9 * len(log_k) // 10
     
-    X = np.vstack([log_lambda[mid_start:mid_end], 
-                   np.ones(mid_end - mid_start)]).T
-    y = log_k[mid_start:mid_end]
-    
-    try:
-        coeffs = np.linalg.lstsq(X, y, rcond=None)[0]
-        spectral_dim = 2 * coeffs[0]
-    except:
-        spectral_dim = 1.0
+    slope, _ = _fit_line(log_lambda[mid_start:mid_end], log_k[mid_start:mid_end])
+    spectral_dim = 2 * slope
     
     # Clamp to reasonable range
     return np.clip(spectral_dim, 0.5, 20.0)
@@ -248,29 +622,45 @@ def estimate_spectral_dimension(eigenvalues: np.ndarray,
 # PART 4: SPECTRAL ZETA FUNCTIONS
 # ==============================================================================
 
-def spectral_zeta(eigenvalues: np.ndarray, s: float, 
+def spectral_zeta(eigenvalues, s: float, 
                   min_eigenvalue: float = 1e-8) -> float:
     """
     Compute spectral zeta function ζ_L(s) = Σ λ_k^{-s}
     
     Args:
-        eigenvalues: Array of positive eigenvalues
+        eigenvalues: Array of eigenvalues, or a SpectralData (cached log λ)
         s: Complex exponent (we use real s here)
         min_eigenvalue: Cutoff for numerical stability
     
     Returns:
         ζ_L(s) value
     """
-    valid = eigenvalues > min_eigenvalue
-    lambdas = eigenvalues[valid]
+    _, log_lambdas = _valid_spectrum(eigenvalues, min_eigenvalue, log=True)
     
-    if len(lambdas) == 0:
+    if len(log_lambdas) == 0:
         return np.inf
     
-    return np.sum(lambdas ** (-s))
+    return np.sum(np.exp(-s * log_lambdas))
+
 
+def _zeta_power_matrix(eigenvalues, s_values: np.ndarray,
+                       min_eigenvalue: float = 1e-8) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (valid mask, P) with P[k, i] = λ_k^{-s_i} over the valid eigenvalues."""
+    valid, log_lambdas = _valid_spectrum(eigenvalues, min_eigenvalue, log=True)
+    s_values = np.asarray(s_values, dtype=log_lambdas.dtype)
+    return valid, np.exp(-np.outer(log_lambdas, s_values))
 
-def spectral_zeta_weighted(eigenvalues: np.ndarray, eigenvectors: np.ndarray,
+
+def spectral_zeta_curve(eigenvalues, s_values: np.ndarray,
+                        min_eigenvalue: float = 1e-8) -> np.ndarray:
+    """Compute ζ_L(s) for a range of s values in one pass over the spectrum."""
+    valid, P = _zeta_power_matrix(eigenvalues, s_values, min_eigenvalue)
+    if not valid.any():
+        return np.full(len(s_values), np.inf)
+    return P.sum(axis=0)
+
+
+def spectral_zeta_weighted(eigenvalues, eigenvectors: np.ndarray,
                            weights: np.ndarray, s: float,
                            min_eigenvalue: float = 1e-8) -> float:
     """
@@ -288,14 +678,13 @@ def spectral_zeta_weighted(eigenvalues: np.ndarray, eigenvectors: np.ndarray,
     Returns:
         Weighted ζ value
     """
-    valid = eigenvalues > min_eigenvalue
-    lambdas = eigenvalues[valid]
+    valid, log_lambdas = _valid_spectrum(eigenvalues, min_eigenvalue, log=True)
     w = weights[valid]
     
-    if len(lambdas) == 0:
+    if len(log_lambdas) == 0:
         return np.inf
     
-    return np.sum(w * (lambdas ** (-s)))
+    return np.sum(w * np.exp(-s * log_lambdas))
 
 
 def concept_spectral_weights(eigenvectors: np.ndarray, 
@@ -303,16 +692,13 @@ def concept_spectral_weights(eigenvectors: np.ndarray,
     """
     Compute weights w_k = ||P_V v_k||^2 measuring how much each
     eigenvector overlaps with the concept subspace V.
-    """
-    n_eigen = eigenvectors.shape[1]
-    weights = np.zeros(n_eigen)
-    
-    for k in range(n_eigen):
-        v_k = eigenvectors[:, k]
-        proj = concept.projection @ v_k
-        weights[k] = np.dot(proj, proj)
     
-    return weights
+    With P_V = U U^T for the concept basis U, ||P_V v_k||^2 = c_k^T (U^T U) c_k
+    where c_k = U^T v_k, so only a (dim(V), n_eigen) GEMM is needed.
+    """
+    UtV = concept.basis.T @ eigenvectors            # (dim V, n_eigen)
+    gram = concept.basis.T @ concept.basis         # I for orthonormal U
+    return np.einsum('ij,ij->j', UtV, gram @ UtV)
 
 
 def spectral_profile(spectral_data: SpectralData, 
@@ -332,30 +718,42 @@ def spectral_profile(spectral_data: SpectralData,
     Returns:
         Array of profile values φ(s) for each s
     """
-    weights = concept_spectral_weights(spectral_data.eigenvectors, concept)
-    eigenvalues = spectral_data.eigenvalues
+    return spectral_profiles(spectral_data, [concept], s_values)[0]
+
+
+def spectral_profiles(spectral_data: SpectralData,
+                      concepts: List[ConceptSubspace],
+                      s_values: np.ndarray) -> np.ndarray:
+    """
+    Spectral profiles φ(s; c) for several concepts at once, shape (n_concepts, n_s).
     
-    profiles = np.zeros_like(s_values)
+    All concept bases are projected onto the eigenbasis with one GEMM, and
+    every profile comes from one (n_concepts, n_valid) @ (n_valid, n_s) product.
+    """
+    V = spectral_data.eigenvectors
+    bases = [c.basis for c in concepts]
+    UtV = np.hstack(bases).T @ V                        # (Σ dim V, n_eigen)
+    splits = np.cumsum([U.shape[1] for U in bases])[:-1]
+    weights = np.stack([
+        np.einsum('ij,ij->j', C, (U.T @ U) @ C)
+        for U, C in zip(bases, np.split(UtV, splits))
+    ])
     
-    for i, s in enumerate(s_values):
-        zeta_total = spectral_zeta(eigenvalues, s)
-        zeta_concept = spectral_zeta_weighted(eigenvalues, 
-                                               spectral_data.eigenvectors,
-                                               weights, s)
-        
-        if zeta_total > 0 and np.isfinite(zeta_total):
-            profiles[i] = zeta_concept / zeta_total
-        else:
-            profiles[i] = np.nan
+    # Both zetas from one (n_valid, n_s) power matrix
+    valid, P = _zeta_power_matrix(spectral_data, s_values)
+    zeta_total = P.sum(axis=0)
+    zeta_concept = weights[:, valid] @ P
     
-    return profiles
+    ok = np.isfinite(zeta_total) & (zeta_total > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(ok, zeta_concept / zeta_total, np.nan)
 
 
 # ==============================================================================
 # PART 5: HEAT KERNEL AND DIFFUSION
 # ==============================================================================
 
-def heat_kernel_trace(eigenvalues: np.ndarray, t: float,
+def heat_kernel_trace(eigenvalues, t: float,
                       min_eigenvalue: float = 1e-8) -> float:
     """
     Compute heat kernel trace K(t) = Tr(e^{-tL}) = Σ e^{-λ_k t}
@@ -363,20 +761,35 @@ def heat_kernel_trace(eigenvalues: np.ndarray, t: float,
     This measures how much a diffusion process has spread after time t.
     - Small t: sensitive to local structure
     - Large t: approaches equilibrium
+    
+    eigenvalues may be a SpectralData, reusing its cached valid spectrum.
     """
-    valid = eigenvalues >= min_eigenvalue
-    lambdas = eigenvalues[valid]
+    _, lambdas = _valid_spectrum(eigenvalues, min_eigenvalue)
     
     return np.sum(np.exp(-lambdas * t))
 
 
-def heat_kernel_curve(eigenvalues: np.ndarray, 
-                      t_values: np.ndarray) -> np.ndarray:
-    """Compute heat kernel trace for range of t values."""
-    return np.array([heat_kernel_trace(eigenvalues, t) for t in t_values])
+def heat_kernel_curve(eigenvalues, 
+                      t_values: np.ndarray,
+                      min_eigenvalue: float = 1e-8,
+                      chunk_elems: int = 1 << 20) -> np.ndarray:
+    """
+    Compute heat kernel trace for range of t values.
+    
+    Evaluates exp(-λ_k t_i) as one outer product, chunked over t so the
+    temporary stays around chunk_elems entries.
+    """
+    _, lambdas = _valid_spectrum(eigenvalues, min_eigenvalue)
+    t_values = np.asarray(t_values, dtype=lambdas.dtype)
+    K = np.empty(len(t_values), dtype=lambdas.dtype)
+    step = max(1, chunk_elems // max(len(lambdas), 1))
+    for start in range(0, len(t_values), step):
+        t_chunk = t_values[start:start + step]
+        K[start:start + step] = np.exp(-np.outer(lambdas, t_chunk)).sum(axis=0)
+    return K
 
 
-def estimate_spectral_dim_from_heat_kernel(eigenvalues: np.ndarray,
+def estimate_spectral_dim_from_heat_kernel(eigenvalues,
                                            num_points: int = 50) -> float:
     """
     Estimate spectral dimension from heat kernel asymptotics.
@@ -397,8 +810,8 @@ def estimate_spectral_dim_from_heat_kernel(eigenvalues: np.ndarray,
     if valid.sum() < 5:
         return 1.0
     
-    coeffs = np.polyfit(log_t[valid], log_K[valid], 1)
-    spectral_dim = -2 * coeffs[0]
+    slope, _ = _fit_line(log_t[valid], log_K[valid])
+    spectral_dim = -2 * slope
     
     return np.clip(spectral_dim, 0.5, 20.0)
 
@@ -418,7 +831,7 @@ def compute_intertwining_error(L1: np.ndarray, L2: np.ndarray,
     return np.linalg.norm(T @ L1 - L2 @ T, 'fro') ** 2
 
 
-def optimal_intertwiner_via_sylvester(L1: np.ndarray, L2: np.ndarray,
+def optimal_intertwiner_via_sylvester(L1, L2,
                                       Z1: np.ndarray, Z2: np.ndarray) -> CrossModalData:
     """
     Find optimal linear map T: R^{d1} → R^{d2} that:
@@ -428,19 +841,31 @@ def optimal_intertwiner_via_sylvester(L1: np.ndarray, L2: np.ndarray,
     The solution uses eigendecomposition to work in spectral coordinates.
     
     Args:
-        L1, L2: Laplacians for the two modalities
+        L1, L2: Laplacians for the two modalities, or their precomputed
+                SpectralData (reuses the eigendecomposition)
         Z1, Z2: Aligned representation matrices (N samples x d dimensions)
     
     Returns:
         CrossModalData with optimal T, spectral correspondence M, and error
     """
-    # Eigendecompose both Laplacians
-    λ1, V1 = np.linalg.eigh(L1)
-    λ2, V2 = np.linalg.eigh(L2)
+    # Eigendecompose both Laplacians (unless already decomposed)
+    def eigenpairs(L):
+        if isinstance(L, SpectralData):
+            return L.eigenvalues, L.eigenvectors
+        return np.linalg.eigh(_to_dense(L))
+    
+    def to_eigenbasis(L, Z, V):
+        # Closed-form bases (path/grid morphisms) transform via DCT
+        if isinstance(L, SpectralData) and L.to_eigenbasis is not None:
+            return L.to_eigenbasis(Z)
+        return Z @ V
+    
+    λ1, V1 = eigenpairs(L1)
+    λ2, V2 = eigenpairs(L2)
     
     # Transform representations to eigenbasis
-    Z1_eigen = Z1 @ V1  # (N, d1)
-    Z2_eigen = Z2 @ V2  # (N, d2)
+    Z1_eigen = to_eigenbasis(L1, Z1, V1)  # (N, d1)
+    Z2_eigen = to_eigenbasis(L2, Z2, V2)  # (N, d2)
     
     # Compute correlation in eigenbasis
     # M[j, i] = correlation between i-th eigendirection of L1 and j-th of L2
@@ -449,25 +874,22 @@ def optimal_intertwiner_via_sylvester(L1: np.ndarray, L2: np.ndarray,
     # Normalize
     M = M / (np.linalg.norm(M) + 1e-10)
     
-    # Reconstruct T in original basis
-    T = V2 @ M @ V1.T
-    
-    # Compute intertwining error
-    error = compute_intertwining_error(L1, L2, T)
+    # Intertwining error, diagonal in the eigenbases:
+    # ||T L1 - L2 T||_F^2 = Σ_{j,i} M[j,i]^2 (λ1[i] - λ2[j])^2,
+    # so T = V2 M V1^T is only built if the caller asks for it
+    gap = np.subtract.outer(λ2, λ1).astype(M.dtype)
+    error = np.sum((M * gap) ** 2)
     
     # Build eigenvalue matching list
-    matching = []
     threshold = 0.1 * np.max(np.abs(M))
-    for i in range(M.shape[1]):
-        for j in range(M.shape[0]):
-            if np.abs(M[j, i]) > threshold:
-                matching.append((λ1[i], λ2[j], M[j, i]))
+    is_, js = np.nonzero(np.abs(M.T) > threshold)  # i-major, as (λ1, λ2) pairs
+    matching = list(zip(λ1[is_], λ2[js], M[js, is_]))
     
     return CrossModalData(
-        intertwiner=T,
         spectral_correspondence=M,
         intertwining_error=error,
-        eigenvalue_matching=matching
+        eigenvalue_matching=matching,
+        eigenbases=(V1, V2)
     )
 
 
@@ -509,7 +931,25 @@ def spectral_norm(z: np.ndarray, L: np.ndarray) -> float:
     so high-frequency components (large eigenvalue directions)
     contribute more.
     """
-    return np.sqrt(np.abs(z @ L @ z))
+    return np.sqrt(np.abs(z @ (L @ z)))
+
+
+def spectral_norm_batch(Z: np.ndarray, L) -> np.ndarray:
+    """
+    Row-wise spectral norms ||z_i||_L for a batch Z of shape (N, d).
+    
+    L may be a SpectralData: with a full spectrum, L = V diag(λ) V^T gives
+    ||z||_L^2 = Σ_k λ_k (V^T z)_k^2, i.e. one GEMM (or DCT) into the
+    eigenbasis for the whole batch and a weighted row sum.
+    """
+    if isinstance(L, SpectralData):
+        if L.eigenvectors.shape[0] == L.eigenvectors.shape[1]:
+            coeffs = (L.to_eigenbasis(Z) if L.to_eigenbasis is not None
+                      else Z @ L.eigenvectors)
+            return np.sqrt(np.abs((coeffs ** 2) @ np.clip(L.eigenvalues, 0, None)))
+        L = L.laplacian
+    LZ = np.asarray(L @ Z.T).T
+    return np.sqrt(np.abs(np.einsum('ij,ij->i', Z, LZ)))
 
 
 def product_formula_value(z_list: List[np.ndarray],
@@ -521,16 +961,11 @@ def product_formula_value(z_list: List[np.ndarray],
     P = Π_ρ ||z_ρ||_{L_ρ}^{1/d_ρ}
     
     For well-aligned multimodal representations, this should be
-    approximately constant across different concepts.
+    approximately constant across different concepts. For many samples
+    use product_formula_values, which batches the quadratic forms.
     """
-    log_product = 0.0
-    
-    for z, L, d_s in zip(z_list, L_list, d_s_list):
-        norm = spectral_norm(z, L)
-        if norm > 0:
-            log_product += np.log(norm) / d_s
-    
-    return np.exp(log_product)
+    z_batch_list = [np.asarray(z)[np.newaxis, :] for z in z_list]
+    return float(product_formula_values(z_batch_list, L_list, d_s_list)[0])
 
 
 def product_formula_loss(z_batch_list: List[np.ndarray],
@@ -545,76 +980,116 @@ def product_formula_loss(z_batch_list: List[np.ndarray],
     
     Args:
         z_batch_list: List of (N, d) arrays, one per modality
-        L_list: Laplacians for each modality
+        L_list: Laplacians (or their SpectralData) for each modality
         d_s_list: Spectral dimensions
     
     Returns:
         Variance of log-product values
     """
+    P = product_formula_values(z_batch_list, L_list, d_s_list)
+    return np.var(np.log(P + 1e-10))
+
+
+def product_formula_values(z_batch_list: List[np.ndarray],
+                           L_list: List[np.ndarray],
+                           d_s_list: List[float]) -> np.ndarray:
+    """
+    Product formula value P for every sample in a batch.
+    
+    One batched quadratic form per modality instead of a per-sample loop.
+    """
     N = z_batch_list[0].shape[0]
-    log_products = np.zeros(N)
+    log_product = np.zeros(N)
     
-    for i in range(N):
-        z_list = [z_batch[i] for z_batch in z_batch_list]
-        P = product_formula_value(z_list, L_list, d_s_list)
-        log_products[i] = np.log(P + 1e-10)
+    for Z, L, d_s in zip(z_batch_list, L_list, d_s_list):
+        norms = spectral_norm_batch(Z, L)
+        positive = norms > 0
+        log_product[positive] += np.log(norms[positive]) / d_s
     
-    return np.var(log_products)
+    return np.exp(log_product)
 
 
 # ==============================================================================
 # PART 8: VISUALIZATION UTILITIES
 # ==============================================================================
 
+def _spectral_summary(spec: SpectralData, t_values: np.ndarray,
+                      s_values: np.ndarray, min_eigenvalue: float = 1e-6,
+                      bins: int = 50) -> Dict:
+    """Every array plot_spectral_comparison draws for one modality (pure NumPy)."""
+    lambdas = spec.eigenvalues[spec.eigenvalues > min_eigenvalue]
+    log_lambda = np.log(lambdas)
+    log_k = np.log(np.arange(1, len(lambdas) + 1))
+    slope, intercept = _fit_line(log_lambda, log_k)
+    x_fit = np.linspace(log_lambda.min(), log_lambda.max(), 100)
+    density, edges = np.histogram(lambdas, bins=bins, density=True)
+    return {
+        'log_lambda': log_lambda,
+        'log_k': log_k,
+        'x_fit': x_fit,
+        'y_fit': slope * x_fit + intercept,
+        'K': heat_kernel_curve(spec, t_values),
+        'zeta': spectral_zeta_curve(spec, s_values),
+        'hist': (density, edges),
+        'lambda_min': lambdas.min(),
+        'lambda_max': spec.eigenvalues.max(),
+        'lambda_mean': lambdas.mean(),
+    }
+
+
 def plot_spectral_comparison(spec_list: List[SpectralData],
                              names: List[str],
-                             figsize: Tuple[int, int] = (14, 10)) -> plt.Figure:
+                             figsize: Tuple[int, int] = (14, 10),
+                             max_workers: Optional[int] = None) -> plt.Figure:
     """
     Comprehensive visualization comparing spectral properties across modalities.
+    
+    All numerics are computed first (one _spectral_summary per modality,
+    on a thread pool since each is GIL-releasing NumPy), then drawn.
     """
     n_modalities = len(spec_list)
+    t_values = np.logspace(-2, 1, 100)
+    s_values = np.linspace(0.5, 3.0, 100)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        summaries = list(pool.map(
+            lambda spec: _spectral_summary(spec, t_values, s_values), spec_list))
+    
     fig = plt.figure(figsize=figsize)
     gs = GridSpec(2, 3, figure=fig)
+    ax1, ax2, ax3 = (fig.add_subplot(gs[0, c]) for c in range(3))
+    ax4, ax5, ax6 = (fig.add_subplot(gs[1, c]) for c in range(3))
     
     colors = plt.cm.tab10(np.linspace(0, 1, n_modalities))
     
-    # 1. Eigenvalue distributions
-    ax1 = fig.add_subplot(gs[0, 0])
-    for i, (spec, name) in enumerate(zip(spec_list, names)):
-        k = np.arange(1, len(spec.eigenvalues) + 1)
-        ax1.plot(k, spec.eigenvalues, '-', color=colors[i], 
-                label=f'{name} (d_s={spec.spectral_dimension:.2f})', linewidth=2)
+    for spec, summary, name, color in zip(spec_list, summaries, names, colors):
+        # 1. Eigenvalue distributions
+        ax1.plot(np.arange(1, len(spec.eigenvalues) + 1), spec.eigenvalues, '-',
+                 color=color, label=f'{name} (d_s={spec.spectral_dimension:.2f})',
+                 linewidth=2)
+        # 2. Weyl's law (log-log) with fit line
+        ax2.plot(summary['log_lambda'], summary['log_k'], 'o', color=color,
+                 label=name, markersize=3, alpha=0.7)
+        ax2.plot(summary['x_fit'], summary['y_fit'], '--', color=color, alpha=0.8)
+        # 3. Heat kernel
+        ax3.plot(t_values, summary['K'], '-', color=color, label=name, linewidth=2)
+        # 4. Spectral zeta functions
+        ax4.plot(s_values, summary['zeta'], '-', color=color, label=name, linewidth=2)
+        # 5. Spectral density (histogram)
+        density, edges = summary['hist']
+        ax5.stairs(density, edges, fill=True, alpha=0.5, color=color, label=name)
+    
     ax1.set_xlabel('Index k')
     ax1.set_ylabel('Eigenvalue λ_k')
     ax1.set_title('Eigenvalue Distribution')
     ax1.legend()
     ax1.set_yscale('log')
     
-    # 2. Weyl's law (log-log)
-    ax2 = fig.add_subplot(gs[0, 1])
-    for i, (spec, name) in enumerate(zip(spec_list, names)):
-        valid = spec.eigenvalues > 1e-6
-        lambdas = spec.eigenvalues[valid]
-        k = np.arange(1, len(lambdas) + 1)
-        ax2.plot(np.log(lambdas), np.log(k), 'o', color=colors[i], 
-                label=name, markersize=3, alpha=0.7)
-        
-        # Fit line
-        coeffs = np.polyfit(np.log(lambdas), np.log(k), 1)
-        x_fit = np.linspace(np.log(lambdas.min()), np.log(lambdas.max()), 100)
-        ax2.plot(x_fit, np.polyval(coeffs, x_fit), '--', color=colors[i], alpha=0.8)
-    
     ax2.set_xlabel('log(λ)')
     ax2.set_ylabel('log(k)')
     ax2.set_title("Weyl's Law: log(k) vs log(λ)")
     ax2.legend()
     
-    # 3. Heat kernel
-    ax3 = fig.add_subplot(gs[0, 2])
-    t_values = np.logspace(-2, 1, 100)
-    for i, (spec, name) in enumerate(zip(spec_list, names)):
-        K_values = heat_kernel_curve(spec.eigenvalues, t_values)
-        ax3.plot(t_values, K_values, '-', color=colors[i], label=name, linewidth=2)
     ax3.set_xlabel('Time t')
     ax3.set_ylabel('K(t) = Tr(exp(-tL))')
     ax3.set_title('Heat Kernel Trace')
@@ -622,41 +1097,27 @@ def plot_spectral_comparison(spec_list: List[SpectralData],
     ax3.set_yscale('log')
     ax3.legend()
     
-    # 4. Spectral zeta functions
-    ax4 = fig.add_subplot(gs[1, 0])
-    s_values = np.linspace(0.5, 3.0, 100)
-    for i, (spec, name) in enumerate(zip(spec_list, names)):
-        zeta_values = [spectral_zeta(spec.eigenvalues, s) for s in s_values]
-        ax4.plot(s_values, zeta_values, '-', color=colors[i], label=name, linewidth=2)
     ax4.set_xlabel('s')
     ax4.set_ylabel('ζ_L(s)')
     ax4.set_title('Spectral Zeta Function')
     ax4.set_yscale('log')
     ax4.legend()
     
-    # 5. Spectral density (histogram)
-    ax5 = fig.add_subplot(gs[1, 1])
-    for i, (spec, name) in enumerate(zip(spec_list, names)):
-        valid = spec.eigenvalues > 1e-6
-        ax5.hist(spec.eigenvalues[valid], bins=50, alpha=0.5, 
-                color=colors[i], label=name, density=True)
     ax5.set_xlabel('Eigenvalue λ')
     ax5.set_ylabel('Density')
     ax5.set_title('Spectral Density')
     ax5.legend()
     
     # 6. Summary statistics
-    ax6 = fig.add_subplot(gs[1, 2])
     ax6.axis('off')
     
     summary_text = "SPECTRAL SUMMARY\n" + "="*40 + "\n\n"
-    for spec, name in zip(spec_list, names):
-        valid = spec.eigenvalues > 1e-6
+    for spec, summary, name in zip(spec_list, summaries, names):
         summary_text += f"{name}:\n"
         summary_text += f"  Spectral dimension: {spec.spectral_dimension:.3f}\n"
-        summary_text += f"  λ_min (nonzero): {spec.eigenvalues[valid].min():.4f}\n"
-        summary_text += f"  λ_max: {spec.eigenvalues.max():.4f}\n"
-        summary_text += f"  λ_mean: {spec.eigenvalues[valid].mean():.4f}\n"
+        summary_text += f"  λ_min (nonzero): {summary['lambda_min']:.4f}\n"
+        summary_text += f"  λ_max: {summary['lambda_max']:.4f}\n"
+        summary_text += f"  λ_mean: {summary['lambda_mean']:.4f}\n"
         summary_text += f"  Num eigenvalues: {len(spec.eigenvalues)}\n\n"
     
     ax6.text(0.1, 0.9, summary_text, transform=ax6.transAxes, 
@@ -808,25 +1269,22 @@ def create_synthetic_multimodal_data(n_samples: int = 500,
     concept_subspaces_text = []
     concept_subspaces_image = []
     
+    # Rank-1 subspaces keep only their basis; projections are lazy
+    image_basis = image_basis[:, :actual_dim]
+    
     for i in range(n_concepts):
         # Text concept subspace
-        basis_text = text_basis[i:i+1].T  # (dim_text, 1)
-        proj_text = basis_text @ basis_text.T
         concept_subspaces_text.append(ConceptSubspace(
             name=f"Concept_{i}_text",
-            projection=proj_text,
             dimension=1,
-            basis=basis_text
+            basis=text_basis[i][:, None]  # (dim_text, 1)
         ))
         
         # Image concept subspace  
-        basis_image = image_basis[i:i+1, :actual_dim].T  # (dim_image, 1)
-        proj_image = basis_image @ basis_image.T
         concept_subspaces_image.append(ConceptSubspace(
             name=f"Concept_{i}_image",
-            projection=proj_image,
             dimension=1,
-            basis=basis_image
+            basis=image_basis[i][:, None]  # (dim_image, 1)
         ))
     
     return {
@@ -844,9 +1302,13 @@ def create_synthetic_multimodal_data(n_samples: int = 500,
     }
 
 
-def run_synthetic_experiment(verbose: bool = True) -> Dict:
+def run_synthetic_experiment(verbose: bool = True,
+                             max_workers: Optional[int] = None) -> Dict:
     """
     Run complete analysis pipeline on synthetic data.
+    
+    Per-modality work (eigendecompositions, concept profiles) runs on a
+    thread pool of max_workers; the underlying LAPACK/BLAS calls release the GIL.
     """
     if verbose:
         print("=" * 70)
@@ -868,8 +1330,10 @@ def run_synthetic_experiment(verbose: bool = True) -> Dict:
     # Compute spectral decompositions
     if verbose:
         print("2. Computing spectral decompositions...")
-    spec_text = compute_spectral_data(data['L_text'])
-    spec_image = compute_spectral_data(data['L_image'])
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        spec_text, spec_image = pool.map(
+            compute_spectral_data, [data['L_text'], data['L_image']]
+        )
     
     if verbose:
         print(f"   Text:  d_s = {spec_text.spectral_dimension:.3f}")
@@ -879,7 +1343,7 @@ def run_synthetic_experiment(verbose: bool = True) -> Dict:
     if verbose:
         print("3. Computing cross-modal intertwiner...")
     cross_modal = optimal_intertwiner_via_sylvester(
-        data['L_text'], data['L_image'],
+        spec_text, spec_image,
         data['Z_text'], data['Z_image']
     )
     
@@ -890,15 +1354,12 @@ def run_synthetic_experiment(verbose: bool = True) -> Dict:
     if verbose:
         print("4. Testing product formula...")
     
-    product_values = []
-    for i in range(min(100, data['n_samples'])):
-        z_list = [data['Z_text'][i], data['Z_image'][i]]
-        L_list = [data['L_text'], data['L_image']]
-        d_s_list = [spec_text.spectral_dimension, spec_image.spectral_dimension]
-        P = product_formula_value(z_list, L_list, d_s_list)
-        product_values.append(P)
-    
-    product_values = np.array(product_values)
+    n_test = min(100, data['n_samples'])
+    product_values = product_formula_values(
+        [data['Z_text'][:n_test], data['Z_image'][:n_test]],
+        [spec_text, spec_image],
+        [spec_text.spectral_dimension, spec_image.spectral_dimension]
+    )
     cv = np.std(product_values) / np.mean(product_values)
     
     if verbose:
@@ -915,12 +1376,16 @@ def run_synthetic_experiment(verbose: bool = True) -> Dict:
     profiles_text = {}
     profiles_image = {}
     
-    for i, (concept_t, concept_i) in enumerate(zip(
-        data['concept_subspaces_text'][:3],  # First 3 concepts
-        data['concept_subspaces_image'][:3]
-    )):
-        profiles_text[f"Concept_{i}"] = spectral_profile(spec_text, concept_t, s_values)
-        profiles_image[f"Concept_{i}"] = spectral_profile(spec_image, concept_i, s_values)
+    # First 3 concepts, all s values in one call per modality, modalities in parallel
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        phi_text, phi_image = pool.map(
+            lambda spec, concepts: spectral_profiles(spec, concepts[:3], s_values),
+            [spec_text, spec_image],
+            [data['concept_subspaces_text'], data['concept_subspaces_image']]
+        )
+    for i, (row_t, row_i) in enumerate(zip(phi_text, phi_image)):
+        profiles_text[f"Concept_{i}"] = row_t
+        profiles_image[f"Concept_{i}"] = row_i
     
     # Compile results
     results = {
@@ -947,9 +1412,110 @@ def run_synthetic_experiment(verbose: bool = True) -> Dict:
 # PART 10: NEURAL NETWORK LAPLACIAN ESTIMATION
 # ==============================================================================
 
+def _knn_graph_laplacian(neighbors: np.ndarray, N: int,
+                         normalized: bool = True) -> sparse.csr_matrix:
+    """
+    Sparse Laplacian of the symmetrized kNN graph.
+    
+    Args:
+        neighbors: (N, k) neighbor indices per sample (self excluded)
+        N: Number of samples
+        normalized: Whether to return D^{-1/2} (D - A) D^{-1/2}
+    """
+    rows = np.repeat(np.arange(N), neighbors.shape[1])
+    cols = neighbors.ravel()
+    A = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(N, N))
+    A.data[:] = 1.0              # duplicate (i, j) entries were summed
+    A = A.maximum(A.T)
+    
+    degrees = np.asarray(A.sum(axis=1)).ravel()
+    L = sparse.csr_matrix(sparse.diags(degrees) - A)
+    
+    if normalized:
+        d_inv_sqrt = 1.0 / np.sqrt(degrees + 1e-10)
+        row_idx = np.repeat(np.arange(N), np.diff(L.indptr))
+        L.data *= d_inv_sqrt[row_idx] * d_inv_sqrt[L.indices]
+    
+    return L
+
+
+def _knn_indices_brute(X: np.ndarray, k: int, block: int = 512) -> np.ndarray:
+    """
+    Exact kNN from squared distances ||x||² + ||y||² - 2 x·y.
+    
+    Rows are processed in blocks so each distance tile is one GEMM that
+    stays cache-resident; argpartition selects, then only k+1 are sorted.
+    """
+    N = X.shape[0]
+    sq = np.einsum('ij,ij->i', X, X)
+    indices = np.empty((N, k + 1), dtype=np.int64)
+    for start in range(0, N, block):
+        stop = min(start + block, N)
+        D2 = sq[start:stop, None] + sq[None, :] - 2.0 * (X[start:stop] @ X.T)
+        local = np.arange(stop - start)
+        D2[local, start + local] = -np.inf      # self always first
+        part = np.argpartition(D2, k, axis=1)[:, :k + 1]
+        order = np.argsort(np.take_along_axis(D2, part, axis=1), axis=1)
+        indices[start:stop] = np.take_along_axis(part, order, axis=1)
+    return indices
+
+
+def _knn_indices(representations: np.ndarray, k: int,
+                 method: str = 'auto') -> np.ndarray:
+    """
+    (N, k+1) nearest-neighbor indices of every sample, self first.
+    
+    method: 'kdtree' (scipy cKDTree, exact, all cores), 'nndescent'
+            (pynndescent approximate graph, dimension-independent cost),
+            'brute' (exact, blocked GEMM distances) or 'auto' (always
+            exact: brute for d > 50, where the tree degrades toward brute
+            force, otherwise kdtree). Approximate search must be requested
+            explicitly, so results never depend on what is installed.
+    """
+    if method == 'auto':
+        method = 'brute' if representations.shape[1] > 50 else 'kdtree'
+    
+    if method == 'brute':
+        return _knn_indices_brute(representations, k)
+    if method == 'kdtree':
+        tree = cKDTree(representations)
+        _, indices = tree.query(representations, k=k+1, workers=-1)
+        return indices
+    if method == 'nndescent':
+        if not HAS_PYNNDESCENT:
+            raise ImportError("kNN method 'nndescent' requires pynndescent")
+        from pynndescent import NNDescent
+        index = NNDescent(representations, n_neighbors=k+1, metric='euclidean',
+                          n_jobs=-1, low_memory=True)
+        indices, _ = index.neighbor_graph
+        return indices
+    raise ValueError(f"Unknown kNN method: {method}")
+
+
+class _BufferPool:
+    """
+    Size-bucketed free lists of NumPy scratch arrays.
+    
+    rent() pops the most recently returned buffer of that (shape, dtype)
+    or allocates one; ret() pushes it back. Contents are not cleared.
+    """
+    
+    def __init__(self):
+        self._free = defaultdict(list)
+    
+    def rent(self, shape: Tuple[int, ...], dtype=np.float64) -> np.ndarray:
+        free = self._free[(tuple(shape), np.dtype(dtype))]
+        return free.pop() if free else np.empty(shape, dtype=dtype)
+    
+    def ret(self, arr: np.ndarray) -> None:
+        self._free[(arr.shape, arr.dtype)].append(arr)
+
+
 def estimate_representation_laplacian(representations: np.ndarray,
                                       k: int = 15,
-                                      normalized: bool = True) -> np.ndarray:
+                                      normalized: bool = True,
+                                      method: str = 'auto',
+                                      pool: Optional[_BufferPool] = None) -> np.ndarray:
     """
     Estimate the effective Laplacian of a representation space
     from samples using k-nearest neighbors graph.
@@ -958,41 +1524,40 @@ def estimate_representation_laplacian(representations: np.ndarray,
         representations: (N, d) array of representation vectors
         k: Number of nearest neighbors
         normalized: Whether to return normalized Laplacian
+        method: kNN backend, 'auto', 'kdtree', 'nndescent' or 'brute'
+                (see _knn_indices)
+        pool: Optional _BufferPool for the (N, d) and (d, d) scratch arrays,
+              reused across calls (e.g. by SpectralProbe in k sweeps)
     
     Returns:
         (d, d) estimated Laplacian in feature space
     """
+    # fp16-stored representations (SpectralProbe precision='fp16') are
+    # widened once here; the kNN search and Z^T L Z run in fp32
+    if representations.dtype == np.float16:
+        representations = representations.astype(np.float32)
     N, d = representations.shape
     
     # Build k-NN graph in sample space
-    from sklearn.neighbors import NearestNeighbors
-    
-    nn = NearestNeighbors(n_neighbors=k+1, metric='euclidean')
-    nn.fit(representations)
-    distances, indices = nn.kneighbors(representations)
-    
-    # Build adjacency matrix
-    A_samples = np.zeros((N, N))
-    for i in range(N):
-        for j in indices[i, 1:]:  # Skip self
-            A_samples[i, j] = 1
-            A_samples[j, i] = 1
-    
-    # Sample Laplacian
-    D_samples = np.diag(A_samples.sum(axis=1))
-    L_samples = D_samples - A_samples
+    indices = _knn_indices(representations, k, method)
     
-    if normalized:
-        d_inv_sqrt = np.diag(1.0 / np.sqrt(A_samples.sum(axis=1) + 1e-10))
-        L_samples = d_inv_sqrt @ L_samples @ d_inv_sqrt
+    L_samples = _knn_graph_laplacian(indices[:, 1:], N, normalized)  # Skip self
     
     # Project to feature space Laplacian via covariance structure
     # L_features ≈ Z^T L_samples Z / N (up to normalization)
-    Z_centered = representations - representations.mean(axis=0)
-    L_features = Z_centered.T @ L_samples @ Z_centered / N
-    
-    # Symmetrize and ensure positive semi-definite
-    L_features = (L_features + L_features.T) / 2
+    pool = pool if pool is not None else _BufferPool()
+    dtype = np.result_type(representations.dtype, np.float32)
+    Z_centered = pool.rent((N, d), dtype)
+    cross = pool.rent((d, d), dtype)
+    try:
+        np.subtract(representations, representations.mean(axis=0), out=Z_centered)
+        np.matmul(Z_centered.T, L_samples @ Z_centered, out=cross)
+        
+        # Symmetrize and ensure positive semi-definite
+        L_features = (cross + cross.T) / (2 * N)
+    finally:
+        pool.ret(cross)
+        pool.ret(Z_centered)
     
     return L_features
 
@@ -1018,14 +1583,21 @@ class SpectralProbe:
         self.representations = None
         self.laplacian = None
         self.spectral_data = None
+        self._pool = _BufferPool()  # scratch arrays reused across estimate_laplacian calls
     
-    def collect_representations(self, data_loader, max_samples: int = 1000):
+    def collect_representations(self, data_loader, max_samples: int = 1000,
+                                precision: str = 'fp32'):
         """
         Collect representations from data.
         
+        precision='fp16' stores each batch as float16, halving the memory
+        held by the probe; estimate_laplacian widens it back to float32.
+        
         Note: This is a template - actual implementation depends on
         the deep learning framework used (PyTorch, JAX, etc.)
         """
+        if precision not in ('fp32', 'fp16'):
+            raise ValueError(f"Unknown precision: {precision}")
         reps = []
         count = 0
         
@@ -1038,6 +1610,8 @@ class SpectralProbe:
                 rep = rep.detach().cpu().numpy()
             elif hasattr(rep, 'numpy'):  # Other tensor types
                 rep = rep.numpy()
+            if precision == 'fp16':
+                rep = np.asarray(rep).astype(np.float16, copy=False)
             reps.append(rep)
             count += len(rep)
             if count >= max_samples:
@@ -1052,7 +1626,7 @@ class SpectralProbe:
             raise ValueError("Must call collect_representations first")
         
         self.laplacian = estimate_representation_laplacian(
-            self.representations, k=k
+            self.representations, k=k, pool=self._pool
         )
         return self.laplacian
     
@@ -1067,9 +1641,10 @@ class SpectralProbe:
         return self.spectral_data
     
     def full_analysis(self, data_loader, k: int = 15, 
-                      max_samples: int = 1000) -> SpectralData:
+                      max_samples: int = 1000,
+                      precision: str = 'fp32') -> SpectralData:
         """Run full spectral analysis pipeline."""
-        self.collect_representations(data_loader, max_samples)
+        self.collect_representations(data_loader, max_samples, precision)
         self.estimate_laplacian(k)
         return self.compute_spectral_data()
 